@@ -0,0 +1,110 @@
+"""Micro-benchmark of model construction from trusted data compared with
+validation.
+
+Run from repository root: `python -m benchmarks.models`.
+"""
+import timeit
+from typing import Any, Callable, Dict, List
+
+from sankaku import models as mdl
+
+
+def make_post(post_id: int, tags: int) -> Dict[str, Any]:
+    """Make raw data of post with specified number of tags."""
+    return {
+        "id": post_id,
+        "rating": "q",
+        "reactions": [],
+        "status": "active",
+        "author": {
+            "id": 2,
+            "name": "anonymous",
+            "avatar": "URL",
+            "avatar_rating": "s"
+        },
+        "sample_url": "URL",
+        "sample_width": 1399,
+        "sample_height": 941,
+        "preview_url": "URL",
+        "preview_width": 300,
+        "preview_height": 202,
+        "file_url": "URL",
+        "width": 5242,
+        "height": 3525,
+        "file_size": 8608194,
+        "file_type": "image/jpeg",
+        "created_at": {"json_class": "Time", "s": 1604093590, "n": 0},
+        "has_children": True,
+        "has_comments": False,
+        "has_notes": False,
+        "is_favorited": False,
+        "user_vote": None,
+        "md5": "ab32849a455e9fca5e5fa24bd036d3e3",
+        "parent_id": None,
+        "change": 56235768,
+        "fav_count": 92,
+        "recommended_posts": -1,
+        "recommended_score": 0,
+        "vote_count": 20,
+        "total_score": 94,
+        "comment_count": None,
+        "source": "",
+        "in_visible_pool": False,
+        "is_premium": False,
+        "is_rating_locked": False,
+        "is_note_locked": False,
+        "is_status_locked": False,
+        "redirect_to_signup": False,
+        "sequence": None,
+        "generation_directives": None,
+        "tags": [
+            {
+                "id": i,
+                "name_en": f"tag{i}",
+                "name_ja": None,
+                "type": 3,
+                "count": 100,
+                "post_count": 100,
+                "pool_count": 0,
+                "series_count": 0,
+                "locale": "en",
+                "rating": "s",
+                "version": 1,
+                "tagName": f"tag{i}",
+                "total_post_count": 100,
+                "total_pool_count": 0,
+                "name": f"tag{i}"
+            }
+            for i in range(tags)
+        ],
+        "video_duration": None
+    }
+
+
+def run(construct: Callable[[Dict[str, Any]], Any], page: List[Dict[str, Any]]) -> None:
+    """Construct models from all items of page."""
+    for data in page:
+        construct(data)
+
+
+def main() -> None:  # noqa: D103
+    page = [make_post(i, tags=25) for i in range(40)]
+    number = 50
+    timings: Dict[str, List[float]] = {"validate": [], "trusted": []}
+    # Runs are interleaved, so that load of machine affects both methods equally
+    for _ in range(7):
+        for name, construct in (
+            ("validate", mdl.Post.model_validate),
+            ("trusted", mdl.Post.construct_trusted)
+        ):
+            timings[name].append(
+                timeit.timeit(lambda: run(construct, page), number=number)
+            )
+    for name, elapsed in timings.items():
+        print(  # noqa: T201
+            f"{name:>8}: {min(elapsed) / number * 1e3:7.3f} ms per page of 40 posts"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Micro-benchmark of slices computation used by browsing methods.
+
+Run from repository root: `python -m benchmarks.slices`.
+"""
+import timeit
+
+from sankaku import constants as const
+from sankaku.clients.clients import (
+    _process_item_range,
+    _process_page_range,
+    _compute_slice
+)
+
+
+def plan(_start: int, _stop: int, _step: int, limit: int) -> int:
+    """Compute slices of all pages and return their number."""
+    item_range = _process_item_range(_start, _stop, _step)
+    page_range = _process_page_range(*item_range[:2], limit=limit)
+    page_numbers = range(*page_range)
+    for page_number in page_numbers:
+        _compute_slice(item_range, page_number, limit=limit)
+    return len(page_numbers)
+
+
+def main() -> None:  # noqa: D103
+    for stop in (1_000, 10_000, const.LAST_RANGE_ITEM, 10*const.LAST_RANGE_ITEM):
+        for limit in (const.BASE_LIMIT, 100):
+            number = 20
+            pages = plan(1, stop, 1, limit)
+            elapsed = min(
+                timeit.repeat(lambda: plan(1, stop, 1, limit), number=number)
+            )
+            print(  # noqa: T201
+                f"items={stop:>9} limit={limit:>3} pages={pages:>6} "
+                f"total={elapsed / number * 1e3:8.3f} ms "
+                f"per page={elapsed / number / pages * 1e6:6.3f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
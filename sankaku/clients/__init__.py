@@ -1,8 +1,11 @@
+from .http_cache import HttpCache, SqliteHttpCache
 from .http_client import HttpClient
 from .clients import *  # noqa: F403
 
 
 __all__ = [  # noqa: F405
+    "HttpCache",
+    "SqliteHttpCache",
     "HttpClient",
     "PostClient",
     "AIClient",
@@ -1,15 +1,48 @@
+import asyncio
+import itertools
 import json
+import os
+import time
 from datetime import datetime
-from typing import Optional, Union, List, Tuple, AsyncIterator
+from functools import partial
+from typing import (
+    Optional,
+    Union,
+    List,
+    Tuple,
+    Dict,
+    Set,
+    Any,
+    Type,
+    TypeVar,
+    Callable,
+    Awaitable,
+    Iterable,
+    AsyncIterable,
+    Hashable,
+    AsyncIterator
+)
 
 from typing_extensions import Literal, Annotated
 
+from aiohttp import ClientError
 from loguru import logger
 
 from sankaku import models as mdl, constants as const, types, errors
 from sankaku.paginators import *  # noqa: F403
-from sankaku.typedefs import ValueRange
+from sankaku.models.base import SankakuResponseModel, Interner
+from sankaku.models.http import PoolConfig, Endpoints
+from sankaku.paginators import CheckpointStore
+from sankaku.typedefs import (
+    ValueRange,
+    DatePartition,
+    IdPartition,
+    Watermark,
+    DownloadStats
+)
+from sankaku.utils import RateLimiter, ModelCache
 from .abc import ABCClient
+from .http_cache import HttpCache
 from .http_client import HttpClient
 
 
@@ -21,15 +54,78 @@ __all__ = [
     "UserClient",
 ]
 
+_T = TypeVar("_T")
+_K = TypeVar("_K")
+_M = TypeVar("_M", bound=SankakuResponseModel)
+
 
 class BaseClient(ABCClient):
-    def __init__(self) -> None:
-        """Base client used for login."""
+    def __init__(
+        self,
+        *,
+        ratelimiter: Optional[RateLimiter] = None,
+        pool: Optional[PoolConfig] = None,
+        media_pool: Optional[PoolConfig] = None,
+        validation: Literal["full", "trusted"] = "full",
+        interner: Optional[Interner] = None,
+        cache: Optional[ModelCache] = None,
+        http_cache: Optional[HttpCache] = None,
+        endpoints: Optional[Endpoints] = None
+    ) -> None:
+        """Base client used for login.
+
+        Args:
+            ratelimiter: Limiter of requests sent by client. It can be shared
+                between several clients to keep them within the same budget
+            pool: Settings of connection pool used for API requests
+            media_pool: Settings of connection pool used for media requests
+            validation: Whether to validate server responses or construct
+                models from trusted data without validation
+            interner: Cache of shared instances used to deduplicate nested
+                objects (e.g. tags and authors) of returned models
+            cache: Cache of models returned by single-item getters (e.g.
+                `get_post()` and `get_tag()`)
+            http_cache: Persistent storage of API responses revalidated by
+                conditional requests (see `HttpClient`)
+            endpoints: Base urls of Sankaku servers (e.g. url of caching proxy,
+                see `sankaku.proxy`). By default requests are sent to Sankaku
+        """
+        self._validation = validation
+        self._interner = interner
+        self._cache = cache
         self._profile: Optional[mdl.ExtendedUser] = None
-        self._http_client: HttpClient = HttpClient()
+        self._http_client: HttpClient = HttpClient(
+            ratelimiter=ratelimiter,
+            pool=pool,
+            media_pool=media_pool,
+            cache=http_cache,
+            endpoints=endpoints
+        )
         self._access_token: Optional[str] = None  # TODO: ability to update access token
         self._token_type: Optional[str] = None
 
+    def _construct(self, model: Type[_M], data: Dict[str, Any]) -> _M:
+        """Construct response model according to client validation mode."""
+        if self._validation == "trusted":
+            instance = model.construct_trusted(data)
+        else:
+            instance = model(**data)
+        if self._interner is not None:
+            instance = self._interner.intern(instance)
+        return instance
+
+    def _get_cached(self, kind: str, key: Hashable) -> Optional[Any]:
+        """Get model cached by single-item getter if cache is enabled."""
+        if self._cache is None:
+            return None
+        return self._cache.get(kind, key)
+
+    def _put_cached(self, kind: str, key: Hashable, model: _M) -> _M:
+        """Cache model returned by single-item getter if cache is enabled."""
+        if self._cache is not None:
+            self._cache.put(kind, key, model)
+        return model
+
     async def _login_via_credentials(self, login: str, password: str) -> None:
         response = await self._http_client.post(
             const.LOGIN_URL,
@@ -125,7 +221,18 @@ class PostClient(BaseClient):
         favorited_by: Optional[str] = None,
         tags: Optional[List[str]] = None,
         added_by: Optional[List[str]] = None,
-        voted: Optional[str] = None
+        voted: Optional[str] = None,
+        limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT,
+        prefetch: int = const.BASE_PREFETCH,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        keyset: bool = False,
+        partition: Optional[Union[DatePartition, IdPartition]] = None,
+        watermark: Optional[Watermark] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        dedup: bool = False,
+        backfill: bool = False,
+        total: Optional[int] = None
     ) -> AsyncIterator[mdl.Post]:
         """Get get a certain range of posts with specific characteristics.
         Range of posts can be specified in the same way as when using built-in
@@ -148,14 +255,87 @@ class PostClient(BaseClient):
             tags: Tags available for search
             added_by: Posts uploaded by specified users
             voted: Posts voted by specified user
+            limit: Number of items fetched per each page request
+            prefetch: Maximum number of page requests kept in flight
+            fields: Fields to keep in returned models (see
+                `SankakuResponseModel.project()`)
+            lazy: Whether to validate nested collections of returned models
+                on first access (see `SankakuResponseModel.lazy()`)
+            keyset: Whether to continue each page from the end of previous
+                one instead of requesting page by its offset. It allows to
+                browse deeper than server permits with offsets, but pages
+                are fetched one by one (without prefetching)
+            partition: Split of search into disjoint shards that are browsed
+                concurrently and returned one after another (newest first)
+            watermark: Position of the newest post seen by previous browsing.
+                Only posts newer than it are returned, and it is moved to the
+                newest returned post when browsing completes
+            checkpoint: Storage of browsing position used to resume
+                interrupted browsing (see `Paginator`)
+            dedup: Whether to drop posts that were already returned (e.g. when
+                posts are shifted to the next page by new uploads)
+            backfill: Whether to request posts that could be skipped between
+                pages (e.g. when posts are shifted to the previous page by
+                deletions). It costs one more request per page with skipped
+                posts (or more if they don't fit into one page)
+            total: Known number of posts found (e.g. post count of searched
+                tag), which is used to avoid requesting pages beyond it
         """
         item_range = _process_item_range(_start, _stop, _step)
-        page_range = _process_page_range(*item_range[:2], limit=const.BASE_LIMIT)
-        slices = _compute_slices(item_range, page_range)
-
-        async for page in PostPaginator(  # noqa: F405
+        if partition is not None:
+            if order not in {None, types.PostOrder.DATE}:
+                raise ValueError("Only posts ordered by date can be partitioned.")
+            elif date is not None and isinstance(partition, DatePartition):
+                raise ValueError("Date can't be specified with date partition.")
+            elif watermark is not None or checkpoint is not None:
+                raise ValueError(
+                    "Watermark and checkpoint can't be used with partition."
+                )
+
+            # Any item of merged range is within the same range of its shard.
+            shards = [
+                self.browse_posts(
+                    item_range[1],
+                    order=order,
+                    date=date,
+                    rating=rating,
+                    threshold=threshold,
+                    hide_posts_in_books=hide_posts_in_books,
+                    file_size=file_size,
+                    file_type=file_type,
+                    video_duration=video_duration,
+                    recommended_for=recommended_for,
+                    favorited_by=favorited_by,
+                    tags=[*(tags or []), shard_tag],
+                    added_by=added_by,
+                    voted=voted,
+                    limit=limit,
+                    prefetch=prefetch,
+                    fields=fields,
+                    lazy=lazy,
+                    keyset=keyset,
+                    dedup=dedup,
+                    backfill=backfill
+                )
+                # The newest shard goes first.
+                for shard_tag in reversed(partition.tags())
+            ]
+            merged = _merge_shards(shards, buffer=limit * prefetch)
+            try:
+                async for post in _slice_items(merged, item_range):
+                    yield post
+            finally:
+                await merged.aclose()
+            return
+
+        page_range = _process_page_range(*item_range[:2], limit=limit)
+
+        async with PostPaginator(  # noqa: F405
             *page_range,
             http_client=self._http_client,
+            validation=self._validation,
+            interner=self._interner,
+            limit=limit,
             order=order,
             date=date,
             rating=rating,
@@ -168,17 +348,29 @@ class PostClient(BaseClient):
             favorited_by=favorited_by,
             tags=tags,
             added_by=added_by,
-            voted=voted
-        ):
-            for post in page.items[slices.pop()]:
-                yield post
+            voted=voted,
+            prefetch=prefetch,
+            fields=fields,
+            lazy=lazy,
+            keyset=keyset,
+            watermark=watermark,
+            checkpoint=checkpoint,
+            dedup=dedup,
+            backfill=backfill,
+            total=total
+        ) as paginator:
+            async for page in paginator:
+                for post in _slice_page(page, item_range, limit=limit):
+                    yield post
 
     async def get_favorited_posts(
         self,
         _start: int,
         _stop: Optional[int] = None,
         _step: Optional[int] = None,
-        /
+        /,
+        *,
+        limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT
     ) -> AsyncIterator[mdl.Post]:
         """Shorthand way to get a certain range of favorited posts of
         currently logged-in user.
@@ -189,13 +381,15 @@ class PostClient(BaseClient):
             _start: Start of the sequence
             _stop: End of the sequence (except this value itself)
             _step: Step of the sequence
+            limit: Number of items fetched per each page request
         """
         if self._profile is None:
             raise errors.LoginRequirementError
 
         async for post in self.browse_posts(
             _start, _stop, _step,
-            favorited_by=self._profile.name
+            favorited_by=self._profile.name,
+            limit=limit
         ):
             yield post
 
@@ -204,7 +398,9 @@ class PostClient(BaseClient):
         _start: int,
         _stop: Optional[int] = None,
         _step: Optional[int] = None,
-        /
+        /,
+        *,
+        limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT
     ) -> AsyncIterator[mdl.Post]:
         """Shorthand way to get a certain range of top posts.
         Range of posts can be specified in the same way as when using built-in
@@ -214,10 +410,12 @@ class PostClient(BaseClient):
             _start: Start of the sequence
             _stop: End of the sequence (except this value itself)
             _step: Step of the sequence
+            limit: Number of items fetched per each page request
         """
         async for post in self.browse_posts(
             _start, _stop, _step,
-            order=types.PostOrder.QUALITY
+            order=types.PostOrder.QUALITY,
+            limit=limit
         ):
             yield post
 
@@ -226,7 +424,9 @@ class PostClient(BaseClient):
         _start: int,
         _stop: Optional[int] = None,
         _step: Optional[int] = None,
-        /
+        /,
+        *,
+        limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT
     ) -> AsyncIterator[mdl.Post]:
         """Shorthand way to get a certain range of popular posts.
         Range of posts can be specified in the same way as when using built-in
@@ -236,10 +436,12 @@ class PostClient(BaseClient):
             _start: Start of the sequence
             _stop: End of the sequence (except this value itself)
             _step: Step of the sequence
+            limit: Number of items fetched per each page request
         """
         async for post in self.browse_posts(
             _start, _stop, _step,
-            order=types.PostOrder.POPULARITY
+            order=types.PostOrder.POPULARITY,
+            limit=limit
         ):
             yield post
 
@@ -248,7 +450,9 @@ class PostClient(BaseClient):
         _start: int,
         _stop: Optional[int] = None,
         _step: Optional[int] = None,
-        /
+        /,
+        *,
+        limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT
     ) -> AsyncIterator[mdl.Post]:
         """Shorthand way to get a certain range of recommended posts for
         currently logged-in user.
@@ -259,13 +463,15 @@ class PostClient(BaseClient):
             _start: Start of the sequence
             _stop: End of the sequence (except this value itself)
             _step: Step of the sequence
+            limit: Number of items fetched per each page request
         """
         if self._profile is None:
             raise errors.LoginRequirementError
 
         async for post in self.browse_posts(
             _start, _stop, _step,
-            recommended_for=self._profile.name
+            recommended_for=self._profile.name,
+            limit=limit
         ):
             yield post
 
@@ -276,7 +482,8 @@ class PostClient(BaseClient):
         _step: Optional[int] = None,
         /,
         *,
-        post_id: int
+        post_id: int,
+        limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT
     ) -> AsyncIterator[mdl.Post]:
         """Get a certain range of posts similar (recommended) for specific post.
         Range of posts can be specified in the same way as when using built-in
@@ -287,32 +494,220 @@ class PostClient(BaseClient):
             _stop: End of the sequence (except this value itself)
             _step: Step of the sequence
             post_id: ID of the post of interest
+            limit: Number of items fetched per each page request
         """
         async for post in self.browse_posts(
             _start, _stop, _step,
-            tags=[f"recommended_for_post:{post_id}"]
+            tags=[f"recommended_for_post:{post_id}"],
+            limit=limit
         ):
             yield post
 
-    async def get_post_comments(self, post_id: int) -> AsyncIterator[mdl.Comment]:
-        """Get all comments of the specific post by its ID."""
-        async for page in Paginator(  # noqa: F405
+    async def get_post_comments(
+        self,
+        post_id: int,
+        *,
+        total: Optional[int] = None
+    ) -> AsyncIterator[mdl.Comment]:
+        """Get all comments of the specific post by its ID.
+
+        Args:
+            post_id: ID of post
+            total: Known number of comments (e.g. `comment_count` of post),
+                which is used to avoid requesting pages beyond it
+        """
+        async with Paginator(  # noqa: F405
             const.LAST_RANGE_ITEM,
             http_client=self._http_client,
+            validation=self._validation,
+            interner=self._interner,
             url=const.COMMENTS_URL.format(post_id=post_id),
-            model=mdl.Comment
-        ):
-            for comment in page.items:
-                yield comment
+            model=mdl.Comment,
+            total=total
+        ) as paginator:
+            async for page in paginator:
+                for comment in page.items:
+                    yield comment
 
     async def get_post(self, post_id: int) -> mdl.Post:
         """Get specific post by its ID."""
+        post = self._get_cached("post", post_id)
+        if post is not None:
+            return post
+
         response = await self._http_client.get(const.POST_URL.format(post_id=post_id))
 
         if not response.ok:
             raise errors.PageNotFoundError(response.status, post_id=post_id)
 
-        return mdl.Post(**response.json)
+        return self._put_cached(
+            "post", post_id, self._construct(mdl.Post, response.json)
+        )
+
+    async def get_posts(
+        self,
+        post_ids: Iterable[int],
+        *,
+        concurrency: int = const.BASE_CONCURRENCY
+    ) -> AsyncIterator[mdl.Post]:
+        """Get posts by their IDs. IDs are packed into searches of up to 100
+        posts per request, and posts that aren't found by search are requested
+        one by one. Posts are returned in order of completion of requests, and
+        posts that don't exist are skipped.
+
+        Args:
+            post_ids: IDs of posts of interest
+            concurrency: Maximum number of requests kept in flight
+        """
+        post_ids = list(dict.fromkeys(post_ids))
+        batches = [
+            post_ids[i:i + const.MAX_LIMIT]
+            for i in range(0, len(post_ids), const.MAX_LIMIT)
+        ]
+        missing: List[int] = []
+
+        async for post in _fetch_concurrently(
+            partial(self._search_posts, missing=missing),
+            batches,
+            concurrency=concurrency
+        ):
+            yield post
+        async for post in _fetch_concurrently(
+            partial(_get_or_skip, self.get_post),
+            missing,
+            concurrency=concurrency
+        ):
+            yield post
+
+    async def _search_posts(
+        self,
+        post_ids: List[int],
+        *,
+        missing: List[int]
+    ) -> List[mdl.Post]:
+        """Search posts by their IDs within single request. IDs of posts that
+        aren't found are added to `missing`.
+        """
+        wanted = set(post_ids)
+        posts = []
+        tag = const.ID_SEARCH_TAG.format(ids=",".join(map(str, post_ids)))
+        try:
+            async for post in self.browse_posts(
+                len(post_ids),
+                tags=[tag],
+                limit=len(post_ids)
+            ):
+                if post.id in wanted:
+                    wanted.remove(post.id)
+                    posts.append(post)
+        except errors.SankakuServerError as e:
+            logger.warning(f"Search of posts by IDs failed: {e}")
+        missing.extend(post_id for post_id in post_ids if post_id in wanted)
+        return posts
+
+    async def download_posts(
+        self,
+        posts: Union[
+            Iterable[Union[mdl.Post, mdl.AIPost]],
+            AsyncIterable[Union[mdl.Post, mdl.AIPost]]
+        ],
+        dest: Union[str, os.PathLike],
+        *,
+        kind: Literal["file", "sample", "preview"] = "file",
+        concurrency: int = const.BASE_DOWNLOAD_CONCURRENCY
+    ) -> DownloadStats:
+        """Download media files of posts into directory through dedicated
+        connection pool (see `HttpClient.download()`). Files are named by post
+        IDs (prefixed with `ai_` for AI posts, so that posts of both kinds can
+        share directory), and files that are already present (or repeated
+        posts) are skipped. Original files are verified by MD5 checksum of their posts.
+        Failed downloads are logged without stopping the rest.
+
+        Args:
+            posts: Posts (or asynchronous iterator of them, e.g. returned by
+                `browse_posts()`) whose media files are downloaded
+            dest: Directory where files are saved
+            kind: Kind of media file (original file, sample or preview)
+            concurrency: Maximum number of files downloaded at once
+
+        Returns:
+            Statistics of downloading, including its throughput
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be a positive number.")
+
+        os.makedirs(dest, exist_ok=True)
+        stats = DownloadStats()
+        # Paths of files that are already downloaded or being downloaded
+        targets: Set[str] = set()
+        started = time.monotonic()
+        pending: Set[asyncio.Future] = set()
+        try:
+            async for post in _iterate(posts):
+                if len(pending) >= concurrency:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        task.result()
+                pending.add(
+                    asyncio.ensure_future(
+                        self._download_post(
+                            post, dest, kind=kind, stats=stats, targets=targets
+                        )
+                    )
+                )
+            if pending:
+                done, pending = await asyncio.wait(pending)
+                for task in done:
+                    task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            stats.seconds = time.monotonic() - started
+
+        logger.info(
+            f"Downloaded {stats.files} files ({stats.size} bytes) "
+            f"at {stats.throughput / 2**20:.2f} MiB/s, "
+            f"skipped {stats.skipped}, failed {stats.failed}."
+        )
+        return stats
+
+    async def _download_post(
+        self,
+        post: Union[mdl.Post, mdl.AIPost],
+        dest: Union[str, os.PathLike],
+        *,
+        kind: str,
+        stats: DownloadStats,
+        targets: Set[str]
+    ) -> None:
+        """Download media file of post and count it in statistics."""
+        url = getattr(post, f"{kind}_url", None)
+        if not url:
+            logger.warning(f"Post {post.id} has no {kind} url.")
+            stats.failed += 1
+            return
+
+        extension = os.path.splitext(url.split("?", 1)[0])[1]
+        prefix = "ai_" if isinstance(post, mdl.AIPost) else ""
+        path = os.path.join(dest, f"{prefix}{post.id}{extension}")
+        if path in targets or os.path.exists(path):
+            stats.skipped += 1
+            return
+        targets.add(path)
+
+        md5 = getattr(post, "md5", None) if kind == "file" else None
+        try:
+            size = await self._http_client.download(url, path, md5=md5)
+        except (errors.SankakuError, ClientError, OSError) as e:
+            logger.warning(f"Failed to download {kind} of post {post.id}: {e}")
+            stats.failed += 1
+            return
+
+        stats.files += 1
+        stats.size += size
 
     async def create_post(self):  # TODO: TBA  # noqa: D102
         raise NotImplementedError
@@ -325,7 +720,14 @@ class AIClient(BaseClient):
         _start: int,
         _stop: Optional[int] = None,
         _step: Optional[int] = None,
-        /
+        /,
+        *,
+        limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT,
+        prefetch: int = const.BASE_PREFETCH,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        watermark: Optional[Watermark] = None,
+        checkpoint: Optional[CheckpointStore] = None
     ) -> AsyncIterator[mdl.AIPost]:
         """Get a certain range of AI created posts from AI dedicated post pages.
         Range of posts can be specified in the same way as when using built-in
@@ -335,22 +737,45 @@ class AIClient(BaseClient):
             _start: Start of the sequence
             _stop: End of the sequence (except this value itself)
             _step: Step of the sequence
+            limit: Number of items fetched per each page request
+            prefetch: Maximum number of page requests kept in flight
+            fields: Fields to keep in returned models (see
+                `SankakuResponseModel.project()`)
+            lazy: Whether to validate nested collections of returned models
+                on first access (see `SankakuResponseModel.lazy()`)
+            watermark: Position of the newest post seen by previous browsing.
+                Only posts newer than it are returned, and it is moved to the
+                newest returned post when browsing completes
+            checkpoint: Storage of browsing position used to resume
+                interrupted browsing (see `Paginator`)
         """
         item_range = _process_item_range(_start, _stop, _step)
-        page_range = _process_page_range(*item_range[:2], limit=const.BASE_LIMIT)
-        slices = _compute_slices(item_range, page_range)
+        page_range = _process_page_range(*item_range[:2], limit=limit)
 
-        async for page in Paginator(  # noqa: F405
+        async with Paginator(  # noqa: F405
             *page_range,
             http_client=self._http_client,
+            validation=self._validation,
+            interner=self._interner,
+            limit=limit,
             url=const.AI_POSTS_URL,
-            model=mdl.AIPost
-        ):
-            for post in page.items[slices.pop()]:
-                yield post
+            model=mdl.AIPost,
+            prefetch=prefetch,
+            fields=fields,
+            lazy=lazy,
+            watermark=watermark,
+            checkpoint=checkpoint
+        ) as paginator:
+            async for page in paginator:
+                for post in _slice_page(page, item_range, limit=limit):
+                    yield post
 
     async def get_ai_post(self, post_id: int) -> mdl.AIPost:
         """Get specific AI post by its ID."""
+        post = self._get_cached("ai_post", post_id)
+        if post is not None:
+            return post
+
         response = await self._http_client.get(
             const.AI_POST_URL.format(post_id=post_id)
         )
@@ -358,7 +783,29 @@ class AIClient(BaseClient):
         if not response.ok:
             raise errors.PageNotFoundError(response.status, post_id=post_id)
 
-        return mdl.AIPost(**response.json)
+        return self._put_cached(
+            "ai_post", post_id, self._construct(mdl.AIPost, response.json)
+        )
+
+    async def get_ai_posts(
+        self,
+        post_ids: Iterable[int],
+        *,
+        concurrency: int = const.BASE_CONCURRENCY
+    ) -> AsyncIterator[mdl.AIPost]:
+        """Get AI posts by their IDs. Posts are returned in order of completion
+        of requests, and posts that don't exist are skipped.
+
+        Args:
+            post_ids: IDs of AI posts of interest
+            concurrency: Maximum number of requests kept in flight
+        """
+        async for post in _fetch_concurrently(
+            partial(_get_or_skip, self.get_ai_post),
+            dict.fromkeys(post_ids),
+            concurrency=concurrency
+        ):
+            yield post
 
     async def create_ai_post(self):  # TODO: TBA  # noqa: D102
         raise NotImplementedError
@@ -378,7 +825,12 @@ class TagClient(BaseClient):
         rating: Optional[types.Rating] = None,
         max_post_count: Optional[int] = None,
         sort_parameter: Optional[types.SortParameter] = None,
-        sort_direction: Optional[types.SortDirection] = None
+        sort_direction: Optional[types.SortDirection] = None,
+        limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT,
+        prefetch: int = const.BASE_PREFETCH,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        checkpoint: Optional[CheckpointStore] = None
     ) -> AsyncIterator[mdl.PageTag]:
         """Get a certain range of tags from tag pages.
         Range of tags can be specified in the same way as when using built-in
@@ -394,26 +846,45 @@ class TagClient(BaseClient):
             max_post_count: Upper threshold for number of posts with tags found
             sort_parameter: Tag sorting parameter
             sort_direction: Tag sorting direction
+            limit: Number of items fetched per each page request
+            prefetch: Maximum number of page requests kept in flight
+            fields: Fields to keep in returned models (see
+                `SankakuResponseModel.project()`)
+            lazy: Whether to validate nested collections of returned models
+                on first access (see `SankakuResponseModel.lazy()`)
+            checkpoint: Storage of browsing position used to resume
+                interrupted browsing (see `Paginator`)
         """
         item_range = _process_item_range(_start, _stop, _step)
-        page_range = _process_page_range(*item_range[:2], limit=const.BASE_LIMIT)
-        slices = _compute_slices(item_range, page_range)
+        page_range = _process_page_range(*item_range[:2], limit=limit)
 
-        async for page in TagPaginator(  # noqa: F405
+        async with TagPaginator(  # noqa: F405
             *page_range,
             http_client=self._http_client,
+            validation=self._validation,
+            interner=self._interner,
+            limit=limit,
             tag_type=tag_type,
             order=order,
             rating=rating,
             max_post_count=max_post_count,
             sort_parameter=sort_parameter,
-            sort_direction=sort_direction
-        ):
-            for tag in page.items[slices.pop()]:
-                yield tag
+            sort_direction=sort_direction,
+            prefetch=prefetch,
+            fields=fields,
+            lazy=lazy,
+            checkpoint=checkpoint
+        ) as paginator:
+            async for page in paginator:
+                for tag in _slice_page(page, item_range, limit=limit):
+                    yield tag
 
     async def get_tag(self, name_or_id: Union[str, int]) -> mdl.WikiTag:
         """Get specific tag by its name or ID."""
+        tag = self._get_cached("tag", name_or_id)
+        if tag is not None:
+            return tag
+
         response = await self._http_client.get(
             const.TAG_WIKI_URL.format(
                 ref="/name" if isinstance(name_or_id, str) else "/id",
@@ -424,7 +895,11 @@ class TagClient(BaseClient):
         if not response.ok:
             raise errors.PageNotFoundError(response.status, name_or_id=name_or_id)
 
-        return mdl.WikiTag(wiki=response.json["wiki"], **response.json["tag"])
+        tag = self._construct(
+            mdl.WikiTag,
+            {**response.json["tag"], "wiki": response.json["wiki"]}
+        )
+        return self._put_cached("tag", name_or_id, tag)
 
 
 class BookClient(BaseClient):
@@ -443,6 +918,16 @@ class BookClient(BaseClient):
         tags: Optional[List[str]] = None,
         added_by: Optional[List[str]] = None,
         voted: Optional[str] = None,
+        limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT,
+        prefetch: int = const.BASE_PREFETCH,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        keyset: bool = False,
+        watermark: Optional[Watermark] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        dedup: bool = False,
+        backfill: bool = False,
+        total: Optional[int] = None
     ) -> AsyncIterator[mdl.PageBook]:
         """Get a certain range of books (pools) from book (pool) pages.
         Range of books can be specified in the same way as when using built-in
@@ -459,31 +944,67 @@ class BookClient(BaseClient):
             tags: Tags available for search
             added_by: Books uploaded by specified users
             voted: Books voted by specified user
+            limit: Number of items fetched per each page request
+            prefetch: Maximum number of page requests kept in flight
+            fields: Fields to keep in returned models (see
+                `SankakuResponseModel.project()`)
+            lazy: Whether to validate nested collections of returned models
+                on first access (see `SankakuResponseModel.lazy()`)
+            keyset: Whether to continue each page from the end of previous
+                one instead of requesting page by its offset. It allows to
+                browse deeper than server permits with offsets, but pages
+                are fetched one by one (without prefetching)
+            watermark: Position of the newest book seen by previous browsing.
+                Only books newer than it are returned, and it is moved to the
+                newest returned book when browsing completes
+            checkpoint: Storage of browsing position used to resume
+                interrupted browsing (see `Paginator`)
+            dedup: Whether to drop books that were already returned (e.g. when
+                books are shifted to the next page by new uploads)
+            backfill: Whether to request books that could be skipped between
+                pages (e.g. when books are shifted to the previous page by
+                deletions). It costs one more request per page
+            total: Known number of books found (e.g. post count of searched
+                tag), which is used to avoid requesting pages beyond it
         """
         item_range = _process_item_range(_start, _stop, _step)
-        page_range = _process_page_range(*item_range[:2], limit=const.BASE_LIMIT)
-        slices = _compute_slices(item_range, page_range)
+        page_range = _process_page_range(*item_range[:2], limit=limit)
 
-        async for page in BookPaginator(  # noqa: F405
+        async with BookPaginator(  # noqa: F405
             *page_range,
             http_client=self._http_client,
+            validation=self._validation,
+            interner=self._interner,
+            limit=limit,
             order=order,
             rating=rating,
             recommended_for=recommended_for,
             favorited_by=favorited_by,
             tags=tags,
             added_by=added_by,
-            voted=voted
-        ):
-            for book in page.items[slices.pop()]:
-                yield book
+            voted=voted,
+            prefetch=prefetch,
+            fields=fields,
+            lazy=lazy,
+            keyset=keyset,
+            watermark=watermark,
+            checkpoint=checkpoint,
+            dedup=dedup,
+            backfill=backfill,
+            total=total
+        ) as paginator:
+            async for page in paginator:
+                for book in _slice_page(page, item_range, limit=limit):
+                    yield book
 
     async def get_favorited_books(
         self,
         _start: int,
         _stop: Optional[int] = None,
         _step: Optional[int] = None,
-        /
+        /,
+        *,
+        limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT
     ) -> AsyncIterator[mdl.PageBook]:
         """Shorthand way to get a certain range of favorited books for
         currently logged-in user.
@@ -494,13 +1015,15 @@ class BookClient(BaseClient):
             _start: Start of the sequence
             _stop: End of the sequence (except this value itself)
             _step: Step of the sequence
+            limit: Number of items fetched per each page request
         """
         if self._profile is None:
             raise errors.LoginRequirementError
 
         async for book in self.browse_books(
             _start, _stop, _step,
-            favorited_by=self._profile.name
+            favorited_by=self._profile.name,
+            limit=limit
         ):
             yield book
 
@@ -509,7 +1032,9 @@ class BookClient(BaseClient):
         _start: int,
         _stop: Optional[int] = None,
         _step: Optional[int] = None,
-        /
+        /,
+        *,
+        limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT
     ) -> AsyncIterator[mdl.PageBook]:
         """Shorthand way to get a certain range of recommended books for
         currently logged-in user.
@@ -520,13 +1045,15 @@ class BookClient(BaseClient):
             _start: Start of the sequence
             _stop: End of the sequence (except this value itself)
             _step: Step of the sequence
+            limit: Number of items fetched per each page request
         """
         if self._profile is None:
             raise errors.LoginRequirementError
 
         async for book in self.browse_books(
             _start, _stop, _step,
-            recommended_for=self._profile.name
+            recommended_for=self._profile.name,
+            limit=limit
         ):
             yield book
 
@@ -535,7 +1062,9 @@ class BookClient(BaseClient):
         _start: int,
         _stop: Optional[int] = None,
         _step: Optional[int] = None,
-        /
+        /,
+        *,
+        limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT
     ) -> AsyncIterator[mdl.PageBook]:
         """Get a certain range of recently read/opened books of currently
         logged-in user.
@@ -546,13 +1075,15 @@ class BookClient(BaseClient):
             _start: Start of the sequence
             _stop: End of the sequence (except this value itself)
             _step: Step of the sequence
+            limit: Number of items fetched per each page request
         """
         if self._profile is None:
             raise errors.LoginRequirementError
 
         async for book in self.browse_books(
             _start, _stop, _step,
-            tags=[f"read:@{self._profile.id}@"]
+            tags=[f"read:@{self._profile.id}@"],
+            limit=limit
         ):
             yield book
 
@@ -563,7 +1094,8 @@ class BookClient(BaseClient):
         _step: Optional[int] = None,
         /,
         *,
-        post_id: int
+        post_id: int,
+        limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT
     ) -> AsyncIterator[mdl.PageBook]:
         """Get a certain range of books related to specific post.
         Range of books can be specified in the same way as when using built-in
@@ -574,27 +1106,57 @@ class BookClient(BaseClient):
             _stop: End of the sequence (except this value itself)
             _step: Step of the sequence
             post_id: ID of the post of interest
+            limit: Number of items fetched per each page request
         """
         item_range = _process_item_range(_start, _stop, _step)
-        page_range = _process_page_range(*item_range[:2], limit=const.BASE_LIMIT)
-        slices = _compute_slices(item_range, page_range)
+        page_range = _process_page_range(*item_range[:2], limit=limit)
 
-        async for page in BookPaginator(  # noqa: F405
+        async with BookPaginator(  # noqa: F405
             *page_range,
             http_client=self._http_client,
+            validation=self._validation,
+            interner=self._interner,
+            limit=limit,
             url=const.RELATED_BOOKS_URL.format(post_id=post_id)
-        ):
-            for book in page.items[slices.pop()]:
-                yield book
+        ) as paginator:
+            async for page in paginator:
+                for book in _slice_page(page, item_range, limit=limit):
+                    yield book
 
     async def get_book(self, book_id: int) -> mdl.Book:
         """Get specific book by its ID."""
+        book = self._get_cached("book", book_id)
+        if book is not None:
+            return book
+
         response = await self._http_client.get(const.BOOK_URL.format(book_id=book_id))
 
         if not response.ok:
             raise errors.PageNotFoundError(response.status, book_id=book_id)
 
-        return mdl.Book(**response.json)
+        return self._put_cached(
+            "book", book_id, self._construct(mdl.Book, response.json)
+        )
+
+    async def get_books(
+        self,
+        book_ids: Iterable[int],
+        *,
+        concurrency: int = const.BASE_CONCURRENCY
+    ) -> AsyncIterator[mdl.Book]:
+        """Get books (pools) by their IDs. Books are returned in order of
+        completion of requests, and books that don't exist are skipped.
+
+        Args:
+            book_ids: IDs of books of interest
+            concurrency: Maximum number of requests kept in flight
+        """
+        async for book in _fetch_concurrently(
+            partial(_get_or_skip, self.get_book),
+            dict.fromkeys(book_ids),
+            concurrency=concurrency
+        ):
+            yield book
 
 
 class UserClient(BaseClient):
@@ -608,6 +1170,10 @@ class UserClient(BaseClient):
         *,
         order: Optional[types.UserOrder] = None,
         level: Optional[types.UserLevel] = None,
+        limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT,
+        prefetch: int = const.BASE_PREFETCH,
+        fields: Optional[List[str]] = None,
+        checkpoint: Optional[CheckpointStore] = None
     ) -> AsyncIterator[mdl.User]:
         """Get a certain range of user profiles from user pages.
         Range of user profiles can be specified in the same way as when using
@@ -619,22 +1185,38 @@ class UserClient(BaseClient):
             _step: Step of the sequence
             order: User order rule
             level: User level type
+            limit: Number of items fetched per each page request
+            prefetch: Maximum number of page requests kept in flight
+            fields: Fields to keep in returned models (see
+                `SankakuResponseModel.project()`)
+            checkpoint: Storage of browsing position used to resume
+                interrupted browsing (see `Paginator`)
         """
         item_range = _process_item_range(_start, _stop, _step)
-        page_range = _process_page_range(*item_range[:2], limit=const.BASE_LIMIT)
-        slices = _compute_slices(item_range, page_range)
+        page_range = _process_page_range(*item_range[:2], limit=limit)
 
-        async for page in UserPaginator(  # noqa: F405
+        async with UserPaginator(  # noqa: F405
             *page_range,
             http_client=self._http_client,
+            validation=self._validation,
+            interner=self._interner,
+            limit=limit,
             order=order,
-            level=level
-        ):
-            for user in page.items[slices.pop()]:
-                yield user
+            level=level,
+            prefetch=prefetch,
+            fields=fields,
+            checkpoint=checkpoint
+        ) as paginator:
+            async for page in paginator:
+                for user in _slice_page(page, item_range, limit=limit):
+                    yield user
 
     async def get_user(self, name_or_id: Union[str, int]) -> mdl.User:
         """Get specific user by its name or ID."""
+        user = self._get_cached("user", name_or_id)
+        if user is not None:
+            return user
+
         response = await self._http_client.get(
             const.USER_URL.format(
                 ref="/name" if isinstance(name_or_id, str) else "",
@@ -645,7 +1227,29 @@ class UserClient(BaseClient):
         if not response.ok:
             raise errors.PageNotFoundError(response.status, name_or_id=name_or_id)
 
-        return mdl.User(**response.json)
+        return self._put_cached(
+            "user", name_or_id, self._construct(mdl.User, response.json)
+        )
+
+    async def get_users(
+        self,
+        names_or_ids: Iterable[Union[str, int]],
+        *,
+        concurrency: int = const.BASE_CONCURRENCY
+    ) -> AsyncIterator[mdl.User]:
+        """Get users by their names or IDs. Users are returned in order of
+        completion of requests, and users that don't exist are skipped.
+
+        Args:
+            names_or_ids: Names or IDs of users of interest
+            concurrency: Maximum number of requests kept in flight
+        """
+        async for user in _fetch_concurrently(
+            partial(_get_or_skip, self.get_user),
+            dict.fromkeys(names_or_ids),
+            concurrency=concurrency
+        ):
+            yield user
 
 
 def _process_item_range(
@@ -680,42 +1284,172 @@ def _process_page_range(
     return _page_start, _page_stop, _page_step
 
 
-def _compute_slices(
+def _slice_page(
+    page: mdl.Page[_T],
     _item_range: Tuple[int, int, int],
-    _page_range: Tuple[int, int, int]
-) -> List[slice]:
-    """Compute slices for further subscription of page items.
+    *,
+    limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT
+) -> List[_T]:
+    """Get items of page that fall within item range. Slice is applied to the
+    items served by page, while items skipped between pages and recovered by
+    backfill are kept regardless of their position.
+    """
+    page_slice = _compute_slice(_item_range, page.number, limit=limit)
+    return [*page.items[:page.backfilled], *page.items[page.backfilled:][page_slice]]
+
+
+def _compute_slice(
+    _item_range: Tuple[int, int, int],
+    _page_number: int,
+    *,
+    limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT
+) -> slice:
+    """Compute slice for further subscription of items of specific page.
+    Slice is computed arithmetically, so its cost doesn't depend on the size
+    of item range.
 
     Usage:
         ```
-        slices = _compute_slices(_item_range, _page_range)
         for page in Paginator(...):
-            for item in page.items(slices.pop()):
+            for item in page.items[_compute_slice(_item_range, page.number)]:
                 ...
         ```
     """
-    # Flat view of item indexes
-    items = range(*_item_range)
-    pages = range(*_page_range)
-    # Reshaped view with grouping item indexes inside relevant page lists.
-    reshaped = [[] for _ in pages]
-    for i in items:
-        page_number = i // const.BASE_LIMIT
-        reshaped[pages.index(page_number)].append(i - page_number*const.BASE_LIMIT)
-
-    slices: List[slice] = []
-    template = range(const.BASE_LIMIT)
-    for page in reshaped:
-        slices.append(
-            slice(
-                template.index(page[0]),
-                template.index(page[-1]) + 1,
-                _item_range[-1]
+    item_start, item_stop, item_step = _item_range
+    page_start = _page_number * limit
+    page_stop = min(page_start + limit, item_stop)
+    # First item of the range that falls on the page.
+    skipped = max(0, -((item_start - page_start) // item_step))
+    first = item_start + skipped*item_step
+    if first >= page_stop:
+        # Range step is larger than page, so page has no items of range.
+        return slice(0, 0)
+    return slice(first - page_start, page_stop - page_start, item_step)
+
+
+async def _slice_items(
+    items: AsyncIterator[_T],
+    _item_range: Tuple[int, int, int]
+) -> AsyncIterator[_T]:
+    """Get items within the range from asynchronous iterator. Iteration stops
+    right after the last item of the range, without waiting for the next one.
+    """
+    start, stop, step = _item_range
+    if start >= stop:
+        return
+
+    index = 0
+    async for item in items:
+        if index >= start and (index - start) % step == 0:
+            yield item
+        index += 1
+        if index >= stop:
+            break
+
+
+async def _merge_shards(
+    shards: List[AsyncIterator[_M]],
+    *,
+    buffer: int
+) -> AsyncIterator[_M]:
+    """Concurrently iterate over shards and return their items shard by shard.
+    Shards must cover successive ranges, from the newest to the oldest one, so
+    that their items keep the order. While items of one shard are returned,
+    the following shards are read ahead into their queues, each holding at
+    most `buffer` items. Shards are no longer read when iteration stops.
+    """
+    queues: List[asyncio.Queue] = [asyncio.Queue(maxsize=buffer) for _ in shards]
+    tasks = [
+        asyncio.ensure_future(_read_shard(shard, queue))
+        for shard, queue in zip(shards, queues)
+    ]
+    try:
+        for queue in queues:
+            item = await _get_shard_item(queue)
+            while item is not None:
+                yield item
+                item = await _get_shard_item(queue)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _read_shard(shard: AsyncIterator[Any], queue: asyncio.Queue) -> None:
+    """Put shard items into the queue followed by `None` as end marker.
+    Exception raised by shard is put into the queue instead of end marker.
+    Reading waits while the queue is full.
+    """
+    try:
+        async for item in shard:
+            await queue.put(item)
+    except Exception as e:
+        await queue.put(e)
+    else:
+        await queue.put(None)
+    finally:
+        # Page requests prefetched by shard are cancelled as well.
+        await shard.aclose()
+
+
+async def _get_shard_item(queue: asyncio.Queue) -> Any:
+    """Get next shard item from queue or `None` if shard is exhausted."""
+    item = await queue.get()
+    if isinstance(item, Exception):
+        raise item
+    return item
+
+
+async def _fetch_concurrently(
+    fetch: Callable[[_K], Awaitable[List[_T]]],
+    keys: Iterable[_K],
+    *,
+    concurrency: int
+) -> AsyncIterator[_T]:
+    """Fetch items by keys keeping at most `concurrency` fetches in flight and
+    yield them in order of completion. Pending fetches are cancelled when
+    iteration stops early.
+    """
+    if concurrency < 1:
+        raise ValueError("Concurrency must be a positive number.")
+
+    keys = iter(keys)
+    pending: Set[asyncio.Future] = {
+        asyncio.ensure_future(fetch(key))
+        for key in itertools.islice(keys, concurrency)
+    }
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
             )
-        )
+            # Refill before yielding, so requests go on while items are consumed.
+            pending.update(
+                asyncio.ensure_future(fetch(key))
+                for key in itertools.islice(keys, len(done))
+            )
+            for task in done:
+                for item in task.result():
+                    yield item
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _iterate(items: Union[Iterable[_T], AsyncIterable[_T]]) -> AsyncIterator[_T]:
+    """Iterate over items of synchronous or asynchronous iterable."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
 
-    # Reverse slices objects for for further usage of slices.pop() with
-    # default behaviour. Without reversing slices list it must be popped from
-    # head (slices.pop(0)), which will cause internal array shifting and memory
-    # reallocations at every iteration.
-    return list(reversed(slices))
+async def _get_or_skip(get: Callable[[_K], Awaitable[_T]], key: _K) -> List[_T]:
+    """Get item by key or nothing if it doesn't exist."""
+    try:
+        return [await get(key)]
+    except errors.PageNotFoundError:
+        return []
@@ -0,0 +1,128 @@
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from typing import Optional, Union
+
+from loguru import logger
+
+from sankaku import constants as const
+from sankaku.models.http import CachedResponse
+
+
+__all__ = ["HttpCache", "SqliteHttpCache"]
+
+
+class HttpCache(ABC):
+    """Abstract storage of responses revalidated by HTTP client."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get stored response or `None` if there is no one."""
+
+    @abstractmethod
+    def save(self, key: str, response: CachedResponse) -> None:
+        """Replace stored response with the new one."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all stored responses."""
+
+
+class SqliteHttpCache(HttpCache):
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        max_entries: Optional[int] = const.BASE_HTTP_CACHE_ENTRIES,
+        timeout: float = const.BASE_HTTP_CACHE_TIMEOUT
+    ) -> None:
+        """Storage of responses in SQLite database, so they survive process
+        restarts. Database can be shared by several processes.
+
+        Database is accessed synchronously, so each request waits for one
+        indexed lookup (and each stored response for one write) in the event
+        loop. It's negligible compared to network requests on local disks, but
+        may be noticeable on network file systems. Failed access to database
+        (e.g. when it stays locked by another process longer than `timeout`)
+        is logged and treated as missing response or skipped save.
+
+        Args:
+            path: Path to database file
+            max_entries: Maximum number of stored responses. The oldest ones
+                are removed once per tenth of this number of saves, so database
+                can exceed it by a tenth. `None` disables the limit
+            timeout: Time in seconds to wait for database locked by another
+                connection. Event loop is blocked while waiting
+        """
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        # Number of saves left until the next pruning of the oldest responses
+        self._saves_to_prune = 0
+        self._connection = sqlite3.connect(self.path, timeout=timeout)
+        self._connection.execute(f"PRAGMA busy_timeout={int(timeout * 1000)}")
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, "
+            "status INTEGER NOT NULL, "
+            "content BLOB NOT NULL, "
+            "etag TEXT, "
+            "last_modified TEXT)"
+        )
+        self._connection.commit()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Get stored response or `None` if there is no one."""
+        try:
+            row = self._connection.execute(
+                "SELECT status, content, etag, last_modified FROM responses "
+                "WHERE key = ?",
+                (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to get response from HTTP cache: {e}")
+            return None
+        return None if row is None else CachedResponse(*row)
+
+    def save(self, key: str, response: CachedResponse) -> None:
+        """Replace stored response with the new one."""
+        try:
+            with self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        response.status,
+                        response.content,
+                        response.etag,
+                        response.last_modified
+                    )
+                )
+                if self.max_entries is not None:
+                    self._saves_to_prune -= 1
+                    if self._saves_to_prune <= 0:
+                        self._prune(self.max_entries)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to save response to HTTP cache: {e}")
+
+    def clear(self) -> None:
+        """Remove all stored responses."""
+        with self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def _prune(self, max_entries: int) -> None:
+        """Remove the oldest responses beyond the limit. Replaced rows get the
+        next row ID, so IDs follow the order in which responses were saved.
+        """
+        self._connection.execute(
+            "DELETE FROM responses WHERE rowid <= ("
+            "SELECT rowid FROM responses ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+            (max_entries,)
+        )
+        self._saves_to_prune = max(1, max_entries // 10)
+
+    def close(self) -> None:
+        """Close connection to database."""
+        self._connection.close()
@@ -1,14 +1,38 @@
+import asyncio
+import hashlib
+import json
 import os
-from typing import Dict, Optional
+import time
+import uuid
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import (
+    Dict,
+    Optional,
+    Mapping,
+    Callable,
+    Hashable,
+    Union,
+    Any,
+    BinaryIO
+)
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, TCPConnector
 from aiohttp_retry import ExponentialRetry, RetryClient
 from loguru import logger
 
 from sankaku import errors, constants as const
 from sankaku.constants import BASE_RETRIES
-from sankaku.models.http import ClientResponse
+from sankaku.models.http import (
+    ClientResponse,
+    CachedResponse,
+    PoolConfig,
+    Endpoints
+)
+from sankaku.utils import RateLimiter
 from .abc import ABCHttpClient
+from .http_cache import HttpCache
 
 
 try:
@@ -16,11 +40,21 @@ try:
 except (ImportError, ModuleNotFoundError):
     SocksProxyConnector = None
 
+try:
+    import orjson  # type: ignore
+except (ImportError, ModuleNotFoundError):
+    orjson = None
+
+try:
+    import msgspec  # type: ignore
+except (ImportError, ModuleNotFoundError):
+    msgspec = None
+
 
 __all__ = ["HttpClient"]
 
 
-def _get_socks_connector() -> Optional[SocksProxyConnector]:  # type: ignore
+def _get_socks_connector(pool: PoolConfig) -> Optional[SocksProxyConnector]:  # type: ignore
     if SocksProxyConnector is None:
         return None
 
@@ -28,22 +62,163 @@ def _get_socks_connector() -> Optional[SocksProxyConnector]:  # type: ignore
     if proxy is None or not proxy.startswith("socks"):
         return None
 
-    return SocksProxyConnector.from_url(proxy)
+    return SocksProxyConnector.from_url(proxy, **pool.connector_kwargs())
+
+
+def _get_json_loads() -> Callable[[bytes], Any]:
+    """Get the fastest JSON decoder available."""
+    if orjson is not None:
+        return orjson.loads
+    elif msgspec is not None:
+        return msgspec.json.decode
+    return json.loads
+
+
+def _create_session(pool: PoolConfig) -> ClientSession:
+    socks_connector = _get_socks_connector(pool)
+    if socks_connector is not None:
+        # use socks connector
+        return ClientSession(connector=socks_connector)
+    # aiohttp will read HTTP_PROXY and HTTPS_PROXY from env
+    return ClientSession(
+        connector=TCPConnector(**pool.connector_kwargs()),
+        trust_env=True
+    )
+
+
+def _get_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Get delay requested by server in `Retry-After` header in seconds."""
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    if value.isdigit():
+        return float(value)
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0)
+
+
+def _get_request_key(
+    method: str,
+    url: str,
+    kwargs: Dict[str, Any]
+) -> Optional[Hashable]:
+    """Get key identifying request by its method, url and arguments (params,
+    headers, etc.), or `None` if arguments can't be hashed.
+    """
+    try:
+        key = (method, url, _freeze(kwargs))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _get_cache_key(url: str, kwargs: Dict[str, Any]) -> str:
+    """Get key of response in HTTP cache. Responses differ between users, so
+    key depends on authorization, which is hashed to not be stored as is.
+    """
+    headers = kwargs.get("headers") or {}
+    data = json.dumps(
+        [url, _freeze(kwargs.get("params") or {}), headers.get("authorization")],
+        default=str
+    )
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def _freeze(value: Any) -> Any:
+    """Convert mappings and sequences to hashable tuples."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    elif isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _write_chunk(file: BinaryIO, digest: Any, chunk: bytes) -> None:
+    """Write chunk of downloaded file and add it to file checksum."""
+    file.write(chunk)
+    digest.update(chunk)
+
+
+def _close_in_background(session: ClientSession) -> None:
+    """Close session of client that is garbage collected without being closed.
+    Closing can't be awaited there, so it is scheduled on running event loop.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    loop.create_task(session.close())
+
+
+class _SharedRequest:
+    """Request shared by concurrent identical GET requests."""
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future: asyncio.Future) -> None:
+        self.future = future
+        # Number of callers awaiting response
+        self.waiters = 0
 
 
 class HttpClient(ABCHttpClient):
-    def __init__(self) -> None:
-        """HTTP client for API requests that instances use a single session."""
+    def __init__(
+        self,
+        *,
+        ratelimiter: Optional[RateLimiter] = None,
+        pool: Optional[PoolConfig] = None,
+        media_pool: Optional[PoolConfig] = None,
+        json_loads: Optional[Callable[[bytes], Any]] = None,
+        coalesce: bool = True,
+        cache: Optional[HttpCache] = None,
+        endpoints: Optional[Endpoints] = None
+    ) -> None:
+        """HTTP client for API requests that instances use a single session.
+        Media files are fetched through separate session, so their downloading
+        can't exhaust connections needed for API requests.
+
+        Args:
+            ratelimiter: Limiter shared by all requests sent by client
+            pool: Settings of connection pool used for API requests
+            media_pool: Settings of connection pool used for media requests
+            json_loads: Function decoding JSON from response body bytes. By
+                default orjson or msgspec is used if installed, otherwise
+                standard json module
+            coalesce: Whether concurrent identical GET requests share single
+                network call and response (decoded once) instead of being
+                sent separately
+            cache: Storage of GET responses that have `ETag` or
+                `Last-Modified` header. Stored responses are revalidated by
+                conditional requests, and their body isn't transferred again
+                while server replies with `304 Not Modified`
+            endpoints: Base urls of Sankaku servers that replace default ones
+                in requested urls (e.g. url of caching proxy, see
+                `sankaku.proxy`)
+        """
+        self.endpoints = endpoints or Endpoints()
         self.headers: Dict[str, str] = const.HEADERS.copy()
+        self.headers["host"] = self.endpoints.host_header
+        self.ratelimiter: RateLimiter = ratelimiter or RateLimiter(
+            rps=const.BASE_RPS,
+            burst=const.BASE_BURST
+        )
+        self.pool = pool or PoolConfig()
+        self.media_pool = media_pool or PoolConfig(limit=const.BASE_MEDIA_CONNECTIONS)
 
-        socks_connector = _get_socks_connector()
-        if socks_connector is not None:
-            # use socks connector
-            kwargs = {"connector": socks_connector}
-        else:
-            # aiohttp will read HTTP_PROXY and HTTPS_PROXY from env
-            kwargs = {"trust_env": True}
-        self._client_session: ClientSession = ClientSession(**kwargs)  # type: ignore
+        self.json_loads = json_loads or _get_json_loads()
+        self.coalesce = coalesce
+        self.cache = cache
+        self._in_flight: Dict[Hashable, _SharedRequest] = {}
+
+        self._client_session: ClientSession = _create_session(self.pool)
+        self._media_session: Optional[ClientSession] = None
 
         retry_options = ExponentialRetry(attempts=BASE_RETRIES)
         self.session: RetryClient = RetryClient(
@@ -53,20 +228,97 @@ class HttpClient(ABCHttpClient):
         )
 
     def __del__(self) -> None:
-        if not self._client_session.closed and self._client_session.connector is not None:  # noqa: E501
-            self._client_session.connector.close()
+        for session in (self._client_session, self._media_session):
+            if session is not None and not session.closed:
+                _close_in_background(session)
+
+    @property
+    def media_session(self) -> ClientSession:
+        """Session with dedicated connection pool for media (CDN) requests."""
+        if self._media_session is None or self._media_session.closed:
+            self._media_session = _create_session(self.media_pool)
+        return self._media_session
 
     async def close(self) -> None:
-        """There is no need to close client with single session."""
+        """Close sessions used for API and media requests."""
+        await self.session.close()
+        if self._media_session is not None:
+            await self._media_session.close()
 
     async def request(self, method: str, url: str, **kwargs) -> ClientResponse:
-        """Make request to specified url."""
+        """Make request to specified url. If identical GET request is already
+        in flight, its response is awaited instead of sending new request.
+        Shared request is cancelled when all its callers are cancelled.
+        """
         if kwargs.get("headers") is None:
             kwargs["headers"] = self.headers
+        url = self.endpoints.resolve(url)
+
+        key = _get_request_key(method, url, kwargs)
+        if not self.coalesce or method != "GET" or key is None:
+            return await self._request(method, url, **kwargs)
+
+        shared = self._in_flight.get(key)
+        if shared is None:
+            shared = _SharedRequest(
+                asyncio.ensure_future(self._request(method, url, **kwargs))
+            )
+            self._in_flight[key] = shared
+            shared.future.add_done_callback(
+                lambda _: self._forget_request(key, shared)
+            )
 
-        response = await self.session.request(method, url, **kwargs)
+        shared.waiters += 1
+        try:
+            # Request goes on for the rest of waiters if one of them is cancelled.
+            return await asyncio.shield(shared.future)
+        finally:
+            shared.waiters -= 1
+            if not shared.waiters and not shared.future.done():
+                # Nobody needs response anymore.
+                shared.future.cancel()
+                self._forget_request(key, shared)
+
+    def _forget_request(self, key: Hashable, shared: _SharedRequest) -> None:
+        """Remove shared request from requests in flight, unless it is
+        already replaced by new identical request.
+        """
+        if self._in_flight.get(key) is shared:
+            del self._in_flight[key]
+
+    async def _request(self, method: str, url: str, **kwargs) -> ClientResponse:
+        """Send request to specified url within rate limit."""
+        cache_key = cached = None
+        if self.cache is not None and method == "GET":
+            cache_key = _get_cache_key(url, kwargs)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                kwargs["headers"] = {**kwargs["headers"], **cached.validators()}
+
+        await self.ratelimiter.acquire()
+        sent_at = time.monotonic()
+        try:
+            response = await self.session.request(method, url, **kwargs)
+        except BaseException:
+            self.ratelimiter.feedback(None, time.monotonic() - sent_at)
+            raise
+        self.ratelimiter.feedback(
+            response.status,
+            time.monotonic() - sent_at,
+            _get_retry_after(response.headers)
+        )
         logger.debug(f"Sent {method} request to {response.url}")
 
+        if cached is not None and response.status == HTTPStatus.NOT_MODIFIED:
+            response.close()
+            logger.debug(f"Used cached response to {method} request")
+            return ClientResponse(
+                cached.status,
+                True,
+                content=cached.content,
+                loads=self.json_loads
+            )
+
         if response.content_type != "application/json":
             raise errors.SankakuServerError(
                 response.status, "Invalid response content type",
@@ -76,16 +328,93 @@ class HttpClient(ABCHttpClient):
         client_response = ClientResponse(
             response.status,
             response.ok,
-            await response.json(encoding="utf-8"),
+            content=await response.read(),
+            loads=self.json_loads
         )
         response.close()
-        logger.debug(
-            f"Request {method} returned response with status "
-            f"[{client_response.status}]: {client_response.json}",
+        if cache_key is not None and response.ok:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag is not None or last_modified is not None:
+                self.cache.save(  # type: ignore[union-attr]
+                    cache_key,
+                    CachedResponse(
+                        response.status,
+                        client_response.content,
+                        etag,
+                        last_modified
+                    )
+                )
+        # Body is decoded for logging only when debug messages are enabled
+        logger.opt(lazy=True).debug(
+            "Request {} returned response with status [{}]: {}",
+            lambda: method,
+            lambda: client_response.status,
+            lambda: client_response.json
         )
 
         return client_response
 
+    async def download(
+        self,
+        url: str,
+        path: Union[str, os.PathLike],
+        *,
+        md5: Optional[str] = None,
+        chunk_size: int = const.DOWNLOAD_CHUNK_SIZE
+    ) -> int:
+        """Download media file through media session, streaming its body to
+        disk in chunks. File is written under unique temporary name and
+        renamed when download completes, so partially downloaded file never
+        takes its path, and concurrent downloads to the same path don't write
+        into the same file. Disk operations run in default executor of event
+        loop, so they don't block other requests.
+
+        Args:
+            url: Url of media file
+            path: Path where file is saved
+            md5: Expected MD5 checksum of file, which is computed while file
+                is written, so file isn't read again
+            chunk_size: Size of chunks written to disk
+
+        Returns:
+            Number of downloaded bytes
+        """
+        path = os.fspath(path)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.part"
+        digest = hashlib.md5()
+        size = 0
+        headers = {"user-agent": self.headers["user-agent"]}
+        loop = asyncio.get_running_loop()
+        try:
+            async with self.media_session.get(url, headers=headers) as response:
+                if not response.ok:
+                    raise errors.SankakuServerError(
+                        response.status, "Failed to download file", url=url
+                    )
+                file = await loop.run_in_executor(None, open, tmp_path, "wb")
+                try:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        await loop.run_in_executor(
+                            None, _write_chunk, file, digest, chunk
+                        )
+                        size += len(chunk)
+                except BaseException:
+                    file.close()
+                    raise
+                await loop.run_in_executor(None, file.close)
+
+            if md5 is not None and digest.hexdigest() != md5:
+                raise errors.ChecksumError
+            await loop.run_in_executor(None, os.replace, tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        logger.debug(f"Downloaded {size} bytes from {url}")
+        return size
+
     async def get(self, url: str, **kwargs) -> ClientResponse:
         """Send GET request to specified url."""
         return await self.request("GET", url, **kwargs)
@@ -20,9 +20,11 @@ API_URL = "https://capi-v2.sankakucomplex.com"
 
 LOGIN_URL = f"{BASE_URL}/auth/token"
 POSTS_URL = f"{API_URL}/posts"
+POSTS_KEYSET_URL = f"{POSTS_URL}/keyset"
 AI_POSTS_URL = f"{API_URL}/ai_posts"
 TAGS_URL = f"{API_URL}/tags"
 BOOKS_URL = f"{API_URL}/pools"
+BOOKS_KEYSET_URL = f"{BOOKS_URL}/keyset"
 USERS_URL = f"{API_URL}/users"
 PROFILE_URL = f"{USERS_URL}/me"
 
@@ -35,8 +37,12 @@ TAG_WIKI_URL = f"{API_URL}/tag-and-wiki{{ref}}/{{name_or_id}}"
 BOOK_URL = f"{BOOKS_URL}/{{book_id}}"
 USER_URL = f"{USERS_URL}{{ref}}/{{name_or_id}}"
 
+DATE_FORMAT = "%Y-%m-%dT%H:%M"  # Format of dates used in search tags
+ID_SEARCH_TAG = "id:{ids}"  # Search tag for posts with comma-separated IDs
+
 BASE_RPS = 3
 BASE_RPM = 180
+BASE_BURST = 3  # Number of requests that can be sent at once after idling
 
 BASE_RANGE_START = 0
 BASE_RANGE_STEP = 1
@@ -46,12 +52,40 @@ BASE_RANGE_STEP = 1
 LAST_RANGE_ITEM = 100_000
 
 BASE_LIMIT = 40  # Limit of items per page
+MAX_LIMIT = 100  # Maximum limit of items per page allowed by server
+
+BASE_PREFETCH = 1  # Number of page requests kept in flight by paginators
+
+BASE_CONCURRENCY = 4  # Number of requests kept in flight by batch methods
+BASE_DOWNLOAD_CONCURRENCY = 8  # Number of media files downloaded at once
+DOWNLOAD_CHUNK_SIZE = 256 * 1024  # Size of chunks written to disk
 
 BASE_RETRIES = 3
 
+BASE_PROXY_PORT = 8080
+BASE_PROXY_TTL = 60  # Time to serve responses from memory by caching proxy
+BASE_HTTP_CACHE_ENTRIES = 100_000  # Number of responses stored on disk
+BASE_HTTP_CACHE_TIMEOUT = 0.5  # Time to wait for database locked by others
+
+# Time to live in seconds of models cached by single-item getters
+CACHE_TTL: Dict[str, float] = {
+    "post": 5 * 60,
+    "ai_post": 5 * 60,
+    "tag": 6 * 60 * 60,
+    "book": 15 * 60,
+    "user": 60 * 60
+}
+
+# Connection pool sizes for API requests and media (CDN) downloads
+BASE_API_CONNECTIONS = 10
+BASE_MEDIA_CONNECTIONS = 32
+BASE_KEEPALIVE_TIMEOUT = 30
+BASE_DNS_CACHE_TTL = 300
+
+OFFSET_FORBIDDEN_ERROR = "snackbar__account_offset-forbidden"
 PAGE_ALLOWED_ERRORS = [
     "snackbar__anonymous-recommendations-limit-reached",
-    "snackbar__account_offset-forbidden"
+    OFFSET_FORBIDDEN_ERROR
 ]
 
 DEFAULT_TOKEN_TYPE = "Bearer"
@@ -9,7 +9,8 @@ __all__ = [
     "SankakuServerError",
     "PaginatorLastPage",
     "PageNotFoundError",
-    "AuthorizationError"
+    "AuthorizationError",
+    "ChecksumError"
 ]
 
 
@@ -39,6 +40,10 @@ class VideoDurationError(SankakuError):
     msg = "Argument is available only with video files."
 
 
+class ChecksumError(SankakuError):
+    msg = "Checksum of downloaded file doesn't match the expected one."
+
+
 class PaginatorLastPage(SankakuError):  # noqa: N818
     msg = "Last available page reached."
 
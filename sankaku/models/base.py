@@ -1,8 +1,446 @@
-from pydantic import BaseModel
+from collections import OrderedDict
+from copy import copy
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union
+)
 
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    Field,
+    PlainSerializer,
+    TypeAdapter,
+    create_model,
+    field_validator
+)
+from pydantic.fields import FieldInfo
+from typing_extensions import Annotated, get_args, get_origin
 
-__all__ = ["SankakuResponseModel"]
+
+__all__ = ["SankakuResponseModel", "Interner"]
+
+_M = TypeVar("_M", bound="SankakuResponseModel")
+
+_Converter = Callable[[Any], Any]
 
 
 class SankakuResponseModel(BaseModel, extra="forbid"):
     """Base model for sankaku JSON responses."""
+    # Fields validated on first access (see `lazy()` method)
+    __lazy_fields__: ClassVar[FrozenSet[str]] = frozenset()
+    # Fields identifying equal instances that can be shared (see `Interner`)
+    __intern_key__: ClassVar[Tuple[str, ...]] = ()
+
+    @classmethod
+    def construct_trusted(cls: Type[_M], data: Dict[str, Any]) -> _M:
+        """Construct model from data that is known to be valid (e.g. previously
+        archived responses) without validation.
+
+        Field validators running in `before` mode are still applied, as well as
+        conversion of nested models, enums and datetime strings, but values are
+        neither checked nor coerced otherwise. Unknown keys are ignored. Missing
+        fields are not defaulted unless model declares default value for them,
+        so that accessing them raises `AttributeError` (e.g. fields that older
+        archived responses don't contain).
+        """
+        values = {}
+        for name, key, convert in _get_construction_plan(cls):
+            if key in data:
+                value = data[key]
+                values[name] = value if convert is None else convert(value)
+        return cls.model_construct(**values)
+
+    @classmethod
+    def project(cls, fields: Iterable[str]) -> Type["SankakuResponseModel"]:
+        """Get lightweight model that contains only specified fields of this
+        model. Fields of nested models can be specified with dots, e.g.
+        `["id", "md5", "tags.name"]`. The rest of response data is skipped
+        without validation.
+
+        Args:
+            fields: Names of fields to keep in projection
+        """
+        return _project(cls, frozenset(fields))
+
+    @classmethod
+    def lazy(cls: Type[_M], fields: Optional[Iterable[str]] = None) -> Type[_M]:
+        """Get subclass of this model where specified fields keep raw JSON
+        data and are validated only on first access. Validated value is cached,
+        so validation is done once per field.
+
+        Args:
+            fields: Names of fields to validate lazily. By default, these are
+                all fields containing collections of nested models
+        """
+        return _make_lazy(cls, None if fields is None else frozenset(fields))
+
+
+class Interner:
+    def __init__(self, maxsize: int = 10_000) -> None:
+        """Bounded cache of model instances that allows identical objects
+        (e.g. popular tags and authors repeated across posts) to share one
+        instance. Least recently used instances are evicted when cache is full.
+        Note that shared instances must not be modified.
+
+        Args:
+            maxsize: Maximum number of cached instances
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._instances: "OrderedDict[Hashable, SankakuResponseModel]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def intern(self, instance: _M) -> _M:
+        """Replace nested objects of model instance with shared ones.
+
+        Returns:
+            Shared instance if model itself can be interned, otherwise the
+            same instance with replaced nested objects
+        """
+        cls = type(instance)
+        values = instance.__dict__
+        for name in _get_intern_fields(cls):
+            value = values.get(name)
+            if isinstance(value, list):
+                value[:] = [
+                    self.intern(item) if isinstance(item, SankakuResponseModel)
+                    else item
+                    for item in value
+                ]
+            elif isinstance(value, SankakuResponseModel):
+                values[name] = self.intern(value)
+
+        get_key = _get_intern_key(cls)
+        if get_key is None:
+            return instance
+
+        key = (cls, get_key(values))
+        instances = self._instances
+        shared = instances.get(key)
+        if shared is None:
+            self.misses += 1
+            instances[key] = instance
+            if len(instances) > self.maxsize:
+                instances.popitem(last=False)
+            return instance
+
+        self.hits += 1
+        instances.move_to_end(key)
+        return shared  # type: ignore
+
+    def clear(self) -> None:
+        """Remove all cached instances."""
+        self._instances.clear()
+
+
+class _RawValue:
+    """Raw JSON data of lazy field that is not validated yet."""
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"<not validated {type(self.value).__name__}>"
+
+
+_LAZY_VALIDATOR = BeforeValidator(_RawValue)
+
+
+class _ProjectionModel(SankakuResponseModel, extra="ignore"):
+    """Base model for projections that skips fields which weren't selected."""
+
+
+@lru_cache(maxsize=None)
+def _project(
+    model: Type[SankakuResponseModel],
+    fields: FrozenSet[str]
+) -> Type[SankakuResponseModel]:
+    nested: Dict[str, Set[str]] = {}
+    for path in fields:
+        name, _, rest = path.partition(".")
+        if name not in model.model_fields:
+            raise ValueError(f"Model {model.__name__} has no field {name!r}.")
+        nested.setdefault(name, set())
+        if rest:
+            nested[name].add(rest)
+
+    definitions: Dict[str, Any] = {}
+    for name in model.model_fields:
+        if name not in nested:
+            continue
+        subfields = nested[name]
+        field = copy(model.model_fields[name])
+        if subfields:
+            field.annotation = _replace_models(
+                field.annotation,
+                lambda m, subfields=subfields: _project(m, frozenset(subfields)),
+                name
+            )
+        definitions[name] = (field.annotation, field)
+
+    validators = {}
+    for name, decorator in model.__pydantic_decorators__.field_validators.items():
+        selected = [f for f in decorator.info.fields if f in nested]
+        if selected:
+            func = getattr(decorator.func, "__func__", decorator.func)
+            validators[name] = field_validator(*selected, mode=decorator.info.mode)(func)  # type: ignore  # noqa: E501
+
+    return create_model(  # type: ignore
+        f"{model.__name__}Projection",
+        __base__=_ProjectionModel,
+        __validators__=validators,
+        **definitions
+    )
+
+
+@lru_cache(maxsize=None)
+def _make_lazy(
+    model: Type[SankakuResponseModel],
+    fields: Optional[FrozenSet[str]]
+) -> Type[SankakuResponseModel]:
+    if fields is None:
+        fields = frozenset(
+            name for name, field in model.model_fields.items()
+            if _contains_model_list(field.annotation)
+        )
+
+    if not fields:
+        return model
+
+    definitions: Dict[str, Any] = {}
+    lazy_fields: Dict[str, _LazyField] = {}
+    for name in fields:
+        if name not in model.model_fields:
+            raise ValueError(f"Model {model.__name__} has no field {name!r}.")
+        field = model.model_fields[name]
+        lazy_fields[name] = _LazyField(name, field.annotation)
+        definitions[name] = (
+            Annotated[
+                Any,
+                _LAZY_VALIDATOR,
+                PlainSerializer(lazy_fields[name].validate)
+            ],
+            Field(field.default, alias=field.alias)
+        )
+
+    lazy_model = create_model(  # type: ignore
+        f"Lazy{model.__name__}",
+        __base__=model,
+        **definitions
+    )
+    for name, lazy_field in lazy_fields.items():
+        setattr(lazy_model, name, lazy_field.as_property())
+    lazy_model.__lazy_fields__ = fields
+    return lazy_model
+
+
+class _LazyField:
+    """Validator of lazy field raw data."""
+
+    def __init__(self, name: str, annotation: Any) -> None:
+        self.name = name
+        self.annotation = annotation
+        self._adapter: Optional[TypeAdapter] = None
+
+    def validate(self, value: Any) -> Any:
+        """Validate raw data if it is not validated yet."""
+        if not isinstance(value, _RawValue):
+            return value
+        if self._adapter is None:
+            # Nested models are made lazy as well. It is done at first
+            # validation, because models can be self-referencing.
+            self._adapter = TypeAdapter(
+                _replace_models(self.annotation, _lazy_or_self)
+            )
+        return self._adapter.validate_python(value.value)
+
+    def as_property(self) -> property:
+        """Get property that validates field value on first access."""
+        name = self.name
+
+        def getter(instance: SankakuResponseModel) -> Any:
+            value = instance.__dict__[name]
+            if isinstance(value, _RawValue):
+                value = instance.__dict__[name] = self.validate(value)
+            return value
+
+        def setter(instance: SankakuResponseModel, value: Any) -> None:
+            instance.__dict__[name] = value
+
+        return property(getter, setter)
+
+
+def _lazy_or_self(model: Type[SankakuResponseModel]) -> Type[SankakuResponseModel]:
+    return model.lazy()
+
+
+def _contains_model_list(annotation: Any) -> bool:
+    origin = get_origin(annotation)
+    if origin is Union:
+        return any(_contains_model_list(arg) for arg in get_args(annotation))
+    elif origin in (list, List):
+        return any(_contains_model(arg) for arg in get_args(annotation))
+    return False
+
+
+def _contains_model(annotation: Any) -> bool:
+    if get_origin(annotation) in (Union, list, List):
+        return any(_contains_model(arg) for arg in get_args(annotation))
+    return isinstance(annotation, type) and issubclass(annotation, SankakuResponseModel)
+
+
+def _replace_models(
+    annotation: Any,
+    replace: Callable[[Type[SankakuResponseModel]], Any],
+    name: str = ""
+) -> Any:
+    """Replace response models inside annotation (including ones wrapped into
+    Optional or List) with the result of `replace` function.
+    """
+    origin = get_origin(annotation)
+    if origin is Union:
+        return Union[tuple(_replace_models(a, replace, name) for a in get_args(annotation))]  # type: ignore  # noqa: E501
+    elif origin in (list, List):
+        return List[_replace_models(get_args(annotation)[0], replace, name)]  # type: ignore
+    elif isinstance(annotation, type) and issubclass(annotation, SankakuResponseModel):
+        return replace(annotation)
+    elif annotation is type(None):
+        return annotation
+    elif replace is _lazy_or_self:
+        return annotation
+    raise ValueError(f"Field {name!r} does not contain nested fields.")
+
+
+@lru_cache(maxsize=None)
+def _get_intern_fields(model: Type[SankakuResponseModel]) -> Tuple[str, ...]:
+    """Get names of fields that can contain internable models."""
+    return tuple(
+        name for name, field in model.model_fields.items()
+        if name not in model.__lazy_fields__
+        and _contains_internable(field.annotation, set())
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_intern_key(
+    model: Type[SankakuResponseModel]
+) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    """Get function extracting intern key from values of model instance."""
+    if not model.__intern_key__:
+        return None
+    return itemgetter(*model.__intern_key__)
+
+
+def _contains_internable(annotation: Any, seen: Set[type]) -> bool:
+    if get_origin(annotation) in (Union, list, List):
+        return any(_contains_internable(arg, seen) for arg in get_args(annotation))
+    elif not isinstance(annotation, type):
+        return False
+    elif not issubclass(annotation, SankakuResponseModel) or annotation in seen:
+        return False
+    elif annotation.__intern_key__:
+        return True
+    seen.add(annotation)
+    return any(
+        _contains_internable(field.annotation, seen)
+        for field in annotation.model_fields.values()
+    )
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@lru_cache(maxsize=None)
+def _get_construction_plan(
+    model: Type[SankakuResponseModel]
+) -> Tuple[Tuple[str, str, Union[_Converter, None]], ...]:
+    """Get tuple of (field name, key in data, converter) for each model field."""
+    validators: Dict[str, List[_Converter]] = {}
+    for decorator in model.__pydantic_decorators__.field_validators.values():
+        if decorator.info.mode != "before":
+            continue
+        for field in decorator.info.fields:
+            validators.setdefault(field, []).append(decorator.func)
+
+    plan = []
+    for name, field in model.model_fields.items():
+        if _is_lazy(field):
+            plan.append((name, field.alias or name, _RawValue))
+            continue
+        convert = _get_converter(field.annotation)
+        field_validators = validators.get(name)
+        if field_validators:
+            convert = _chain(field_validators, convert or _identity)
+        plan.append((name, field.alias or name, convert))
+    return tuple(plan)
+
+
+def _is_lazy(field: FieldInfo) -> bool:
+    return any(metadata is _LAZY_VALIDATOR for metadata in field.metadata)
+
+
+def _chain(validators: List[_Converter], convert: _Converter) -> _Converter:
+    def inner(value: Any) -> Any:
+        for validator in validators:
+            value = validator(value)
+        return convert(value)
+
+    return inner
+
+
+def _get_converter(annotation: Any) -> Union[_Converter, None]:  # noqa: PLR0911
+    """Get function converting raw JSON value into value of annotated type or
+    None if value can be used as is.
+    """
+    origin = get_origin(annotation)
+    if origin is Union:
+        converters = [
+            _get_converter(arg) for arg in get_args(annotation) if arg is not type(None)
+        ]
+        if len(converters) != 1 or converters[0] is None:
+            return None
+        convert_arg = converters[0]
+        return lambda value: None if value is None else convert_arg(value)
+    elif origin in (list, List):
+        args = get_args(annotation)
+        convert_item = _get_converter(args[0]) if args else None
+        if convert_item is None:
+            return None
+        return lambda value: [
+            None if item is None else convert_item(item) for item in value
+        ]
+    elif not isinstance(annotation, type):
+        return None
+    elif issubclass(annotation, SankakuResponseModel):
+        return annotation.construct_trusted
+    elif issubclass(annotation, Enum):
+        # Lookup of member by value (or member itself, e.g. returned by field
+        # validator) without going through `EnumMeta.__call__`
+        members = {**annotation._value2member_map_, **{m: m for m in annotation}}
+        return lambda value: members[value] if value in members else annotation(value)
+    elif issubclass(annotation, datetime):
+        adapter = TypeAdapter(datetime)
+        return lambda value: adapter.validate_python(value) if isinstance(value, str) else value  # noqa: E501
+    return None
@@ -1,13 +1,160 @@
-from dataclasses import dataclass
-from typing import Any
+import json
+from dataclasses import dataclass, field
+from ssl import SSLContext
+from typing import Any, Optional, Dict, Callable
+from urllib.parse import urlsplit
 
+from sankaku import constants as const
 
-__all__ = ["ClientResponse"]
 
+__all__ = ["ClientResponse", "CachedResponse", "PoolConfig", "Endpoints"]
 
-@dataclass()
+_MISSING = object()
+
+
+@dataclass(init=False)
 class ClientResponse:
-    """Dataclass that preserves information from aiohttp ClientResponse."""
+    """Dataclass that preserves information from aiohttp ClientResponse.
+    Response body is decoded from JSON on first access to `json` attribute.
+    """
     status: int
     ok: bool
-    json: Any
+    content: bytes = field(default=b"", repr=False)
+    loads: Callable[[bytes], Any] = field(
+        default=json.loads,
+        repr=False,
+        compare=False
+    )
+
+    def __init__(
+        self,
+        status: int,
+        ok: bool,
+        json: Any = _MISSING,
+        *,
+        content: bytes = b"",
+        loads: Callable[[bytes], Any] = json.loads
+    ) -> None:
+        """Response of HTTP request.
+
+        Args:
+            status: Response status
+            ok: Whether response status is successful
+            json: Already decoded response body
+            content: Raw response body decoded on first access to `json`
+            loads: Function decoding JSON from raw response body
+        """
+        self.status = status
+        self.ok = ok
+        self.content = content
+        self.loads = loads
+        self._json: Any = json
+
+    @property
+    def json(self) -> Any:
+        """Decoded response body."""
+        if self._json is _MISSING:
+            self._json = self.loads(self.content) if self.content else None
+        return self._json
+
+    @json.setter
+    def json(self, value: Any) -> None:
+        self._json = value
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Dataclass that describes response stored by HTTP cache.
+
+    Attributes:
+        status: Status of the original response
+        content: Body of the original response
+        etag: Value of `ETag` header used to revalidate response
+        last_modified: Value of `Last-Modified` header used to revalidate
+            response
+    """
+    status: int
+    content: bytes = field(repr=False)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def validators(self) -> Dict[str, str]:
+        """Get headers of conditional request that revalidates response."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Dataclass that describes settings of HTTP connection pool.
+
+    Attributes:
+        limit: Total number of simultaneous connections
+        limit_per_host: Number of simultaneous connections to the same host
+            (0 means no limit)
+        keepalive_timeout: Time in seconds to keep idle connection open
+        ttl_dns_cache: Time in seconds to cache DNS lookups (None means forever)
+        use_dns_cache: Whether to cache DNS lookups at all
+        enable_cleanup_closed: Whether to abort SSL connections that were not
+            shut down properly by server
+        ssl: SSL context shared by all connections of the pool, so
+            certificates are loaded once
+    """
+    limit: int = const.BASE_API_CONNECTIONS
+    limit_per_host: int = 0
+    keepalive_timeout: float = const.BASE_KEEPALIVE_TIMEOUT
+    ttl_dns_cache: Optional[int] = const.BASE_DNS_CACHE_TTL
+    use_dns_cache: bool = True
+    enable_cleanup_closed: bool = False
+    ssl: Optional[SSLContext] = None
+
+    def connector_kwargs(self) -> Dict[str, Any]:
+        """Get keyword arguments for aiohttp connector."""
+        kwargs: Dict[str, Any] = {
+            "limit": self.limit,
+            "limit_per_host": self.limit_per_host,
+            "keepalive_timeout": self.keepalive_timeout,
+            "ttl_dns_cache": self.ttl_dns_cache,
+            "use_dns_cache": self.use_dns_cache,
+            "enable_cleanup_closed": self.enable_cleanup_closed,
+        }
+        if self.ssl is not None:
+            kwargs["ssl"] = self.ssl
+        return kwargs
+
+
+@dataclass(frozen=True)
+class Endpoints:
+    """Dataclass that describes base urls of Sankaku servers. Urls of requests
+    built from default base urls (`constants.API_URL` and `constants.BASE_URL`)
+    are rewritten to these, so client can target a mirror, a caching proxy or
+    a mock server.
+
+    Attributes:
+        api_url: Base url of API requests
+        login_url: Base url of login requests
+        host: Value of `host` header sent with requests (by default host of
+            `api_url`)
+    """
+    api_url: str = const.API_URL
+    login_url: str = const.BASE_URL
+    host: Optional[str] = None
+
+    @property
+    def host_header(self) -> str:
+        """Value of `host` header sent with requests."""
+        return self.host or urlsplit(self.api_url).netloc
+
+    def resolve(self, url: str) -> str:
+        """Rewrite url built from default base url to configured one."""
+        for default, base in (
+            (const.API_URL, self.api_url),
+            (const.BASE_URL, self.login_url)
+        ):
+            if base != default and url.startswith(default):
+                return f"{base.rstrip('/')}{url[len(default):]}"
+        return url
@@ -12,3 +12,6 @@ class Page(Generic[_T]):
     """Model that describes page containing content with specific type."""
     number: int
     items: List[_T]
+    # Number of items at the start of page that were skipped between previous
+    # page and this one (see `backfill` argument of paginators)
+    backfilled: int = 0
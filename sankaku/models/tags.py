@@ -41,6 +41,8 @@ class TagMixin(SankakuResponseModel):
 
 class PostTag(BaseTag, TagMixin):
     """Model that describes tags related to posts."""
+    __intern_key__ = ("id", "version")
+
     locale: Optional[str]
     version: Optional[int]
 
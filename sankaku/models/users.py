@@ -20,6 +20,7 @@ class BaseUser(SankakuResponseModel):
 
 class Author(BaseUser):
     """Model that describes users who are the authors of posts or wiki pages."""
+    __intern_key__ = ("id", "name", "avatar", "avatar_rating")
 
 
 class User(BaseUser):
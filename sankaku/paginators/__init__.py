@@ -1 +1,2 @@
+from .checkpoints import *  # noqa: F403
 from .paginators import *  # noqa: F403
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar, AsyncIterator
 
+from typing_extensions import Self
+
 from sankaku import errors, models as mdl
 
 
@@ -15,6 +17,12 @@ class ABCPaginator(ABC, Generic[_T]):
         """Abstract paginator class."""
         pass
 
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     def __aiter__(self) -> AsyncIterator[mdl.Page[_T]]:
         return self
 
@@ -28,6 +36,9 @@ class ABCPaginator(ABC, Generic[_T]):
     async def next_page(self) -> mdl.Page[_T]:
         """Get paginator next page."""
 
+    def close(self) -> None:
+        """Release resources (e.g. pending requests) held by paginator."""
+
     @abstractmethod
     def complete_params(self) -> None:
         """Complete params passed to paginator for further use."""
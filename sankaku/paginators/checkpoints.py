@@ -0,0 +1,59 @@
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, Any, Union
+
+
+__all__ = ["CheckpointStore", "FileCheckpointStore"]
+
+
+class CheckpointStore(ABC):
+    """Abstract storage of paginator checkpoint."""
+
+    @abstractmethod
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Load saved checkpoint or `None` if there is no one."""
+
+    @abstractmethod
+    def save(self, state: Dict[str, Any]) -> None:
+        """Replace saved checkpoint with the new one."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove saved checkpoint."""
+
+
+class FileCheckpointStore(CheckpointStore):
+    def __init__(self, path: Union[str, os.PathLike]) -> None:
+        """Storage of paginator checkpoint in JSON file. File is replaced
+        atomically, so it always contains either previous or new checkpoint
+        even if process is killed while saving.
+
+        Args:
+            path: Path to checkpoint file
+        """
+        self.path = os.fspath(path)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Load saved checkpoint or `None` if there is no one."""
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def save(self, state: Dict[str, Any]) -> None:
+        """Replace saved checkpoint with the new one."""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        """Remove saved checkpoint."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
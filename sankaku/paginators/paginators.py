@@ -1,13 +1,21 @@
+import asyncio
+from collections import deque
 from datetime import datetime
-from typing import Optional, TypeVar, List, Dict, Type
+from functools import lru_cache
+from typing import Optional, TypeVar, List, Dict, Type, Deque, Any, Tuple
 
+from loguru import logger
+from pydantic import TypeAdapter
 from typing_extensions import Literal, Annotated
 
 from sankaku import models as mdl, constants as const, types, errors
 from sankaku.clients import HttpClient
-from sankaku.utils import ratelimit
-from sankaku.typedefs import ValueRange
+from sankaku.models.base import Interner
+from sankaku.models.http import ClientResponse
+from sankaku.typedefs import ValueRange, Watermark
+from sankaku.utils import SeenIds
 from .abc import ABCPaginator
+from .checkpoints import CheckpointStore
 
 
 __all__ = [
@@ -20,6 +28,32 @@ __all__ = [
 
 _T = TypeVar("_T")
 
+# Endpoints that support continuation of pages by cursor
+_KEYSET_URLS = {
+    const.POSTS_URL: const.POSTS_KEYSET_URL,
+    const.BOOKS_URL: const.BOOKS_KEYSET_URL
+}
+
+
+def _dump_watermark(watermark: Optional[Watermark]) -> Optional[List[Any]]:
+    if watermark is None:
+        return None
+    created_at = watermark.created_at
+    return [watermark.id, created_at.isoformat() if created_at else None]
+
+
+def _load_watermark(
+    data: List[Any]
+) -> Tuple[Optional[int], Optional[datetime]]:
+    item_id, created_at = data
+    return item_id, datetime.fromisoformat(created_at) if created_at else None
+
+
+@lru_cache(maxsize=None)
+def _get_list_adapter(model: Type[_T]) -> TypeAdapter[List[_T]]:
+    """Get cached adapter that validates JSON list of model items."""
+    return TypeAdapter(List[model])  # type: ignore[valid-type]
+
 
 class Paginator(ABCPaginator[_T]):
     def __init__(
@@ -32,7 +66,19 @@ class Paginator(ABCPaginator[_T]):
         http_client: HttpClient,
         url: str,
         model: Type[_T],
-        limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT
+        limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT,
+        prefetch: int = const.BASE_PREFETCH,
+        validation: Literal["full", "trusted"] = "full",
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        interner: Optional[Interner] = None,
+        keyset: bool = False,
+        watermark: Optional[Watermark] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        dedup: bool = False,
+        backfill: bool = False,
+        total: Optional[int] = None,
+        stop_on_short_page: bool = False
     ) -> None:
         """Basic paginator for iteration in a certain range.
         Range of pages can be specified in the same way as when using built-in
@@ -46,6 +92,37 @@ class Paginator(ABCPaginator[_T]):
             url: Target API url
             model: Type of response model to be returned inside page items
             limit: Limit of items per each fetched page
+            prefetch: Maximum number of page requests kept in flight
+            validation: Whether to validate page items or construct them from
+                trusted data without validation
+            fields: Fields of model to keep in page items (see
+                `SankakuResponseModel.project()`)
+            lazy: Whether to validate nested collections of page items on
+                first access (see `SankakuResponseModel.lazy()`)
+            interner: Cache of shared instances used to deduplicate nested
+                objects of page items (see `Interner`)
+            keyset: Whether to continue each page from the end of previous
+                one instead of requesting page by its offset
+            watermark: Position of the newest item seen by previous browsing.
+                Iteration stops when it is reached, and watermark is moved to
+                the newest item when either it or the last item is reached.
+                Items must be ordered from newest to oldest
+            checkpoint: Storage of paginator position. Position is saved
+                every time the next page is requested (i.e. previous one is
+                consumed), iteration is resumed from saved position and
+                checkpoint is cleared when iteration completes. IDs of
+                returned items are saved as well when `dedup` is enabled
+            dedup: Whether to drop items that were already returned (e.g. when
+                items are shifted to the next page by new uploads)
+            backfill: Whether to request items that could be skipped between
+                pages (e.g. when items are shifted to the previous page by
+                deletions). Items must be ordered from newest to oldest, and
+                server must support `id_range` search tag. Implies `dedup`
+            total: Known number of items (e.g. post count of searched tag),
+                which is used to avoid requesting pages beyond it
+            stop_on_short_page: Whether page containing fewer items than
+                limit is the last one, so that the next (empty) page isn't
+                requested. Server must return full pages except the last one
         """
         # TODO: Raise error if self._start less than or equal 0.
         if _stop is None and _step is None:
@@ -60,36 +137,163 @@ class Paginator(ABCPaginator[_T]):
             self._start = _start
             self._stop = _stop
             self._step = _step
+        if total is not None:
+            self._stop = min(self._stop, -(-total // limit))  # type: ignore
         self._current_page = self._start
 
+        if prefetch < 1:
+            raise ValueError("Prefetch window must contain at least one page.")
+        elif keyset and prefetch > 1:
+            raise ValueError(
+                "Keyset pagination fetches pages one by one, "
+                "so they can't be prefetched."
+            )
+
         self.http_client = http_client
-        self.url = url
+        self.url = _KEYSET_URLS.get(url, url) if keyset else url
         self.model = model
+        if fields is not None:
+            self.model = self.model.project(fields)  # type: ignore
+        if lazy:
+            self.model = self.model.lazy()  # type: ignore
         self.limit = limit
+        self.prefetch = prefetch
+        self.validation = validation
+        self.interner = interner
+        self.keyset = keyset
+        self.watermark = watermark
+        if watermark is not None and not {"id", "created_at"} <= set(
+            self.model.model_fields  # type: ignore[attr-defined]
+        ):
+            raise ValueError("Watermark requires `id` and `created_at` fields.")
+        self.backfill = backfill
+        # IDs of returned items
+        self._seen = SeenIds() if dedup or backfill else None
+        if self._seen is not None and "id" not in self.model.model_fields:  # type: ignore[attr-defined]
+            raise ValueError("Deduplication requires `id` field.")
+        # The lowest ID of returned items, where the next page should continue
+        self._lowest_id: Optional[int] = None
+
+        # Pages that are already requested but not yet returned to the consumer
+        self._pending: Deque[asyncio.Task] = deque()
+        self._scheduled_page = self._start
+
+        # Position after the last fetched page in keyset mode: either cursor
+        # returned by server or ID of the last item.
+        self._keyset_page = const.BASE_RANGE_START
+        self._next_cursor: Optional[str] = None
+        self._last_id: Optional[int] = None
+
+        # The newest item since watermark and whether watermark is reached
+        self._newest: Optional[Watermark] = None
+        self._watermark_reached = False
+        self.stop_on_short_page = stop_on_short_page
+        # Whether server has no more items, i.e. the last page is returned or
+        # the next one is empty. Unlike stop of range, this means that all items
+        # since watermark are returned.
+        self._exhausted = False
 
         self.params: Dict[str, str] = {}
         self.complete_params()
 
-    @ratelimit(rps=const.BASE_RPS)
+        self.checkpoint = checkpoint
+        if checkpoint is not None:
+            state = checkpoint.load()
+            if state is not None:
+                self._restore(state)
+
     async def next_page(self) -> mdl.Page[_T]:
         """Get paginator next page."""
-        if self._current_page >= self._stop:  # type: ignore
+        if self.checkpoint is not None:
+            self.checkpoint.save(self._dump())
+
+        try:
+            if self._watermark_reached or self._exhausted:
+                raise errors.PaginatorLastPage
+            elif self.keyset:
+                page = await self._next_keyset_page()
+            else:
+                page = await self._next_offset_page()
+            if not page.items:
+                self._exhausted = True
+                self.close()
+                raise errors.PaginatorLastPage
+            if self.stop_on_short_page and len(page.items) < self.limit:
+                # Page that isn't full is the last one, so there is no need
+                # to request the next (empty) one.
+                self._exhausted = True
+                self.close()
+            if self._seen is not None:
+                await self._deduplicate(page)
+            if self.watermark is not None:
+                self._cut_at_watermark(page)
+        except errors.PaginatorLastPage:
+            if self._watermark_reached or self._exhausted:
+                # Iteration stopped by range or by server refusing to return
+                # deep pages may leave items since watermark unseen.
+                self._advance_watermark()
+            if self.checkpoint is not None:
+                self.checkpoint.clear()
+            raise
+        return page
+
+    def _dump(self) -> Dict[str, Any]:
+        """Dump position of paginator into JSON serializable checkpoint."""
+        return {
+            "url": self.url,
+            "params": {k: v for k, v in self.params.items() if k != "page"},
+            "page": self._current_page,
+            "keyset_page": self._keyset_page,
+            "next_cursor": self._next_cursor,
+            "last_id": self._last_id,
+            "watermark": _dump_watermark(self.watermark),
+            "newest": _dump_watermark(self._newest),
+            "watermark_reached": self._watermark_reached,
+            "exhausted": self._exhausted,
+            "seen": None if self._seen is None else self._seen.dump(),
+            "lowest_id": self._lowest_id
+        }
+
+    def _restore(self, state: Dict[str, Any]) -> None:
+        """Restore position of paginator from checkpoint."""
+        params = {k: v for k, v in self.params.items() if k != "page"}
+        if state["url"] != self.url or state["params"] != params:
+            raise ValueError("Checkpoint was saved by paginator with another query.")
+
+        self._current_page = self._scheduled_page = state["page"]
+        self.params["page"] = str(self._current_page + 1)
+        self._keyset_page = state["keyset_page"]
+        self._next_cursor = state["next_cursor"]
+        self._last_id = state["last_id"]
+        if self.watermark is not None and state["watermark"] is not None:
+            self.watermark.id, self.watermark.created_at = _load_watermark(
+                state["watermark"]
+            )
+        if state["newest"] is not None:
+            self._newest = Watermark(*_load_watermark(state["newest"]))
+        self._watermark_reached = state["watermark_reached"]
+        self._exhausted = state["exhausted"]
+        if self._seen is not None and state["seen"] is not None:
+            self._seen = SeenIds.load(state["seen"])
+        self._lowest_id = state["lowest_id"]
+
+    async def _next_offset_page(self) -> mdl.Page[_T]:
+        """Get next page requested by its offset."""
+        self._fill_window()
+        if not self._pending:
             raise errors.PaginatorLastPage
 
-        response = await self.http_client.get(self.url, params=self.params)
-        json_ = response.json
-        if "code" in json_ and json_["code"] in const.PAGE_ALLOWED_ERRORS:
-            raise errors.PaginatorLastPage
-        elif "code" in json_:
-            raise errors.SankakuServerError(response.status, **response.json)
-        elif json_ == [] or (isinstance(json_, dict) and not json_["data"]):
-            raise errors.PaginatorLastPage
-        elif "data" in json_:
-            response.json = json_["data"]
+        try:
+            page = await self._pending.popleft()
+        except BaseException:
+            # The page is either the last one or failed to fetch, so
+            # pages requested after it are no longer needed.
+            self.close()
+            raise
 
-        self._current_page += self._step  # type: ignore
+        self._current_page = page.number + self._step  # type: ignore
         self.params["page"] = str(self._current_page + 1)
-        return self._construct_page(response.json)
+        return page
 
     def complete_params(self) -> None:
         """Complete params passed to paginator for further use."""
@@ -97,13 +301,195 @@ class Paginator(ABCPaginator[_T]):
         self.params["page"] = str(self._current_page + 1)
         self.params["limit"] = str(self.limit)
 
-    def _construct_page(self, data: List[dict]) -> mdl.Page[_T]:
+    def close(self) -> None:
+        """Cancel page requests that are still in flight."""
+        while self._pending:
+            task = self._pending.pop()
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                # Retrieve exception to prevent asyncio from logging it.
+                task.exception()
+        # Nothing should be scheduled after paginator closing.
+        self._scheduled_page = self._stop
+
+    async def _deduplicate(self, page: mdl.Page[_T]) -> None:
+        """Remove already returned items from page and, if backfill is
+        enabled, add items skipped between previous page and this one.
+        """
+        gap: List[_T] = []
+        if self.backfill and self._lowest_id is not None:
+            # The newest item of page that wasn't returned yet.
+            first_id = next(
+                (i.id for i in page.items if i.id < self._lowest_id),  # type: ignore
+                None
+            )
+            if first_id is not None and first_id + 1 < self._lowest_id:
+                gap = await self._fetch_gap(
+                    first_id + 1, self._lowest_id - 1, page.number
+                )
+
+        gap = [i for i in gap if self._seen.add(i.id)]  # type: ignore
+        items = [i for i in page.items if self._seen.add(i.id)]  # type: ignore
+        page.items[:] = [*gap, *items]
+        page.backfilled = len(gap)
+        if page.items:
+            lowest_id = page.items[-1].id  # type: ignore[attr-defined]
+            if self._lowest_id is None or lowest_id < self._lowest_id:
+                self._lowest_id = lowest_id
+
+    async def _fetch_gap(self, low: int, high: int, number: int) -> List[_T]:
+        """Fetch items with IDs in range between pages. Gap can be larger than
+        page, so range is narrowed down to the lowest fetched ID after each
+        page until its lower bound is reached.
+        """
+        tags = self.params.get("tags", "").split()
+        gap: List[_T] = []
+        while low <= high:
+            params = {
+                **self.params,
+                "page": "1",
+                "tags": " ".join([*tags, f"id_range:{low}..{high}"])
+            }
+            response = await self.http_client.get(self.url, params=params)
+            try:
+                data = self._extract_items(response)
+            except errors.PaginatorLastPage:
+                break
+            items = self._construct_page(data, number).items
+            if not items:
+                break
+            gap.extend(items)
+            if self.stop_on_short_page and len(items) < self.limit:
+                break
+            high = min(item.id for item in items) - 1  # type: ignore[attr-defined]
+        return gap
+
+    def _cut_at_watermark(self, page: mdl.Page[_T]) -> None:
+        """Remove already seen items from page."""
+        for i, item in enumerate(page.items):
+            if self.watermark.is_reached(item.id, item.created_at):  # type: ignore
+                self._watermark_reached = True
+                self.close()
+                del page.items[i:]
+                page.backfilled = min(page.backfilled, i)
+                break
+
+        if self._newest is None and page.items:
+            newest = page.items[0]
+            self._newest = Watermark(newest.id, newest.created_at)  # type: ignore
+        if not page.items:
+            raise errors.PaginatorLastPage
+
+    def _advance_watermark(self) -> None:
+        """Move watermark to the newest item after completed iteration."""
+        if self.watermark is not None and self._newest is not None:
+            self.watermark.id = self._newest.id
+            self.watermark.created_at = self._newest.created_at
+            self._newest = None
+
+    def _fill_window(self) -> None:
+        """Schedule fetching of the following pages until prefetch window
+        is full.
+        """
+        while (
+            len(self._pending) < self.prefetch
+            and self._scheduled_page < self._stop  # type: ignore
+        ):
+            self._pending.append(
+                asyncio.ensure_future(self._fetch_page(self._scheduled_page))
+            )
+            self._scheduled_page += self._step  # type: ignore
+
+    async def _fetch_page(self, number: int) -> mdl.Page[_T]:
+        """Fetch page with specific number from server."""
+        params = {**self.params, "page": str(number + 1)}
+        response = await self.http_client.get(self.url, params=params)
+        if (
+            self.validation == "full"
+            and not getattr(self.model, "__lazy_fields__", None)
+            and response.content.lstrip()[:1] == b"["
+        ):
+            # Fast path: plain list of items is validated straight from
+            # response bytes without building intermediate dicts. Models
+            # with lazy fields are faster to build from decoded JSON, since
+            # their raw nested data is kept as is.
+            items = _get_list_adapter(self.model).validate_json(response.content)
+            return self._make_page(items, number)
+
+        return self._construct_page(self._extract_items(response), number)
+
+    async def _next_keyset_page(self) -> mdl.Page[_T]:
+        """Fetch pages one after another, continuing from the end of previous
+        one, until the next page of the range is reached.
+        """
+        while self._keyset_page < self._stop:  # type: ignore
+            number = self._keyset_page
+            page = await self._fetch_keyset_page(number)
+            self._keyset_page += 1
+            # Pages before the range start or between its steps are skipped,
+            # since there is no way to jump over them.
+            offset = number - self._start
+            if not page.items or (offset >= 0 and offset % self._step == 0):  # type: ignore
+                self._current_page = number + self._step  # type: ignore
+                return page
+
+        raise errors.PaginatorLastPage
+
+    async def _fetch_keyset_page(self, number: int) -> mdl.Page[_T]:
+        """Fetch page following the previous one from server."""
+        if number > 0 and self._next_cursor is None and self._last_id is None:
+            # Server has reported that there are no more pages.
+            return self._make_page([], number)
+
+        params = {k: v for k, v in self.params.items() if k != "page"}
+        if self._next_cursor is not None:
+            params["next"] = self._next_cursor
+        elif self._last_id is not None:
+            tags = params.get("tags", "").split()
+            params["tags"] = " ".join([*tags, f"id_range:<{self._last_id}"])
+
+        response = await self.http_client.get(self.url, params=params)
+        items = self._extract_items(response)
+        json_ = response.json
+        if isinstance(json_, dict) and "meta" in json_:
+            self._next_cursor = json_["meta"].get("next")
+            self._last_id = None
+        else:
+            # There is no cursor, so next page starts after the last item.
+            self._next_cursor = None
+            self._last_id = items[-1]["id"] if items else None
+        return self._construct_page(items, number)
+
+    def _extract_items(self, response: ClientResponse) -> List[dict]:
+        """Extract raw page items from server response."""
+        json_ = response.json
+        if "code" in json_ and json_["code"] in const.PAGE_ALLOWED_ERRORS:
+            if json_["code"] == const.OFFSET_FORBIDDEN_ERROR:
+                logger.warning(
+                    "Server refused to return pages this deep, so iteration "
+                    "is stopped. Use keyset pagination to continue further."
+                )
+            raise errors.PaginatorLastPage
+        elif "code" in json_:
+            raise errors.SankakuServerError(response.status, **response.json)
+        elif "data" in json_:
+            json_ = json_["data"]
+        return json_
+
+    def _construct_page(self, data: List[dict], number: int) -> mdl.Page[_T]:
         """Construct and return page model."""
-        items = [self.model(**d) for d in data]
-        return mdl.Page[_T](
-            number=self._current_page - self._step,  # type: ignore
-            items=items
-        )
+        if self.validation == "trusted":
+            items = [self.model.construct_trusted(d) for d in data]  # type: ignore
+        else:
+            items = _get_list_adapter(self.model).validate_python(data)
+        return self._make_page(items, number)
+
+    def _make_page(self, items: List[_T], number: int) -> mdl.Page[_T]:
+        """Make page model from constructed items."""
+        if self.interner is not None:
+            items = [self.interner.intern(item) for item in items]
+        return mdl.Page[_T](number=number, items=items)
 
 
 class PostPaginator(Paginator[mdl.Post]):
@@ -118,6 +504,17 @@ class PostPaginator(Paginator[mdl.Post]):
         url: str = const.POSTS_URL,
         model: Type[mdl.Post] = mdl.Post,
         limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT,
+        prefetch: int = const.BASE_PREFETCH,
+        validation: Literal["full", "trusted"] = "full",
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        interner: Optional[Interner] = None,
+        keyset: bool = False,
+        watermark: Optional[Watermark] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        dedup: bool = False,
+        backfill: bool = False,
+        total: Optional[int] = None,
         order: Optional[types.PostOrder] = None,
         date: Optional[List[datetime]] = None,
         rating: Optional[types.Rating] = None,
@@ -144,6 +541,26 @@ class PostPaginator(Paginator[mdl.Post]):
             url: Target API url
             model: Type of response model to be returned inside page items
             limit: Limit of items per each fetched page
+            prefetch: Maximum number of page requests kept in flight
+            validation: Whether to validate page items or construct them from
+                trusted data without validation
+            fields: Fields of model to keep in page items (see
+                `SankakuResponseModel.project()`)
+            lazy: Whether to validate nested collections of page items on
+                first access (see `SankakuResponseModel.lazy()`)
+            interner: Cache of shared instances used to deduplicate nested
+                objects of page items (see `Interner`)
+            keyset: Whether to continue each page from the end of previous
+                one instead of requesting page by its offset
+            watermark: Position of the newest item seen by previous browsing
+                (see `Paginator`)
+            checkpoint: Storage of paginator position used to resume
+                iteration (see `Paginator`)
+            dedup: Whether to drop items that were already returned
+            backfill: Whether to request items that could be skipped between
+                pages (see `Paginator`)
+            total: Known number of items, which is used to avoid requesting
+                pages beyond it
             order: Post order rule
             date: Date or range of dates
             rating: Post rating
@@ -158,6 +575,9 @@ class PostPaginator(Paginator[mdl.Post]):
             added_by: Posts uploaded by specified users
             voted: Posts voted by specified user
         """
+        if watermark is not None and order not in {None, types.PostOrder.DATE}:
+            raise ValueError("Watermark requires posts to be ordered by date.")
+
         self.order = order
         self.date = date
         self.rating = rating
@@ -178,7 +598,20 @@ class PostPaginator(Paginator[mdl.Post]):
             http_client=http_client,
             url=url,
             model=model,
-            limit=limit
+            limit=limit,
+            prefetch=prefetch,
+            validation=validation,
+            fields=fields,
+            lazy=lazy,
+            interner=interner,
+            keyset=keyset,
+            watermark=watermark,
+            checkpoint=checkpoint,
+            dedup=dedup,
+            backfill=backfill,
+            total=total,
+            # Post pages are always full except the last one.
+            stop_on_short_page=True
         )
 
     def complete_params(self) -> None:  # noqa: PLR0912
@@ -197,7 +630,7 @@ class PostPaginator(Paginator[mdl.Post]):
             elif k == "file_size":
                 self.tags.append(self.file_size.value)  # type: ignore
             elif k == "date":
-                date = "..".join(d.strftime("%Y-%m-%dT%H:%M") for d in self.date)  # type: ignore  # noqa: E501
+                date = "..".join(d.strftime(const.DATE_FORMAT) for d in self.date)  # type: ignore  # noqa: E501
                 self.tags.append(f"date:{date}")
             elif k == "video_duration" and self.file_type is not types.FileType.VIDEO:  # noqa
                 raise errors.VideoDurationError
@@ -228,6 +661,12 @@ class TagPaginator(Paginator[mdl.PageTag]):
         url: str = const.TAGS_URL,
         model: Type[mdl.PageTag] = mdl.PageTag,
         limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT,
+        prefetch: int = const.BASE_PREFETCH,
+        validation: Literal["full", "trusted"] = "full",
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        interner: Optional[Interner] = None,
+        checkpoint: Optional[CheckpointStore] = None,
         tag_type: Optional[types.TagType] = None,
         order: Optional[types.TagOrder] = None,
         rating: Optional[types.Rating] = None,
@@ -247,6 +686,17 @@ class TagPaginator(Paginator[mdl.PageTag]):
             url: Target API url
             model: Type of response model to be returned inside page items
             limit: Limit of items per each fetched page
+            prefetch: Maximum number of page requests kept in flight
+            validation: Whether to validate page items or construct them from
+                trusted data without validation
+            fields: Fields of model to keep in page items (see
+                `SankakuResponseModel.project()`)
+            lazy: Whether to validate nested collections of page items on
+                first access (see `SankakuResponseModel.lazy()`)
+            interner: Cache of shared instances used to deduplicate nested
+                objects of page items (see `Interner`)
+            checkpoint: Storage of paginator position used to resume
+                iteration (see `Paginator`)
             tag_type: Tag type filter
             order: Tag order rule
             rating: Tag rating
@@ -267,7 +717,13 @@ class TagPaginator(Paginator[mdl.PageTag]):
             http_client=http_client,
             url=url,
             model=model,
-            limit=limit
+            limit=limit,
+            prefetch=prefetch,
+            validation=validation,
+            fields=fields,
+            lazy=lazy,
+            interner=interner,
+            checkpoint=checkpoint
         )
 
     def complete_params(self) -> None:
@@ -300,6 +756,17 @@ class BookPaginator(Paginator[mdl.PageBook]):
         url: str = const.BOOKS_URL,
         model: Type[mdl.PageBook] = mdl.PageBook,
         limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT,
+        prefetch: int = const.BASE_PREFETCH,
+        validation: Literal["full", "trusted"] = "full",
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        interner: Optional[Interner] = None,
+        keyset: bool = False,
+        watermark: Optional[Watermark] = None,
+        checkpoint: Optional[CheckpointStore] = None,
+        dedup: bool = False,
+        backfill: bool = False,
+        total: Optional[int] = None,
         order: Optional[types.BookOrder] = None,
         rating: Optional[types.Rating] = None,
         recommended_for: Optional[str] = None,
@@ -320,6 +787,26 @@ class BookPaginator(Paginator[mdl.PageBook]):
             url: Target API url
             model: Type of response model to be returned inside page items
             limit: Limit of items per each fetched page
+            prefetch: Maximum number of page requests kept in flight
+            validation: Whether to validate page items or construct them from
+                trusted data without validation
+            fields: Fields of model to keep in page items (see
+                `SankakuResponseModel.project()`)
+            lazy: Whether to validate nested collections of page items on
+                first access (see `SankakuResponseModel.lazy()`)
+            interner: Cache of shared instances used to deduplicate nested
+                objects of page items (see `Interner`)
+            keyset: Whether to continue each page from the end of previous
+                one instead of requesting page by its offset
+            watermark: Position of the newest item seen by previous browsing
+                (see `Paginator`)
+            checkpoint: Storage of paginator position used to resume
+                iteration (see `Paginator`)
+            dedup: Whether to drop items that were already returned
+            backfill: Whether to request items that could be skipped between
+                pages (see `Paginator`)
+            total: Known number of items, which is used to avoid requesting
+                pages beyond it
             order: Book order rule
             rating: Books rating
             recommended_for: Books recommended for specified user
@@ -328,7 +815,10 @@ class BookPaginator(Paginator[mdl.PageBook]):
             added_by: Books uploaded by specified users
             voted: Books voted by specified user
         """
-        self.order = order
+        if watermark is not None and order not in {None, types.BookOrder.DATE}:
+            raise ValueError("Watermark requires books to be ordered by date.")
+
+        self.order = types.BookOrder.DATE if watermark is not None else order
         self.rating = rating
         self.recommended_for = recommended_for
         self.favorited_by = favorited_by
@@ -342,7 +832,18 @@ class BookPaginator(Paginator[mdl.PageBook]):
             http_client=http_client,
             url=url,
             model=model,
-            limit=limit
+            limit=limit,
+            prefetch=prefetch,
+            validation=validation,
+            fields=fields,
+            lazy=lazy,
+            interner=interner,
+            keyset=keyset,
+            watermark=watermark,
+            checkpoint=checkpoint,
+            dedup=dedup,
+            backfill=backfill,
+            total=total
         )
 
     def complete_params(self) -> None:
@@ -380,6 +881,12 @@ class UserPaginator(Paginator[mdl.User]):
         url: str = const.USERS_URL,
         model: Type[mdl.User] = mdl.User,
         limit: Annotated[int, ValueRange(1, 100)] = const.BASE_LIMIT,
+        prefetch: int = const.BASE_PREFETCH,
+        validation: Literal["full", "trusted"] = "full",
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        interner: Optional[Interner] = None,
+        checkpoint: Optional[CheckpointStore] = None,
         order: Optional[types.UserOrder] = None,
         level: Optional[types.UserLevel] = None
     ) -> None:
@@ -395,6 +902,17 @@ class UserPaginator(Paginator[mdl.User]):
             url: Target API url
             model: Type of response model to be returned inside page items
             limit: Limit of items per each fetched page
+            prefetch: Maximum number of page requests kept in flight
+            validation: Whether to validate page items or construct them from
+                trusted data without validation
+            fields: Fields of model to keep in page items (see
+                `SankakuResponseModel.project()`)
+            lazy: Whether to validate nested collections of page items on
+                first access (see `SankakuResponseModel.lazy()`)
+            interner: Cache of shared instances used to deduplicate nested
+                objects of page items (see `Interner`)
+            checkpoint: Storage of paginator position used to resume
+                iteration (see `Paginator`)
             order: User order rule
             level: User level type
         """
@@ -407,7 +925,13 @@ class UserPaginator(Paginator[mdl.User]):
             http_client=http_client,
             url=url,
             model=model,
-            limit=limit
+            limit=limit,
+            prefetch=prefetch,
+            validation=validation,
+            fields=fields,
+            lazy=lazy,
+            interner=interner,
+            checkpoint=checkpoint
         )
 
     def complete_params(self) -> None:
@@ -0,0 +1,152 @@
+"""Caching proxy of Sankaku API shared by clients of several processes.
+
+Usage:
+    ```
+    python -m sankaku.proxy --port 8080 --rps 3 --cache sankaku-cache.db
+    ```
+"""
+import argparse
+import sys
+from typing import Optional, List
+
+from aiohttp import web, ClientError
+from loguru import logger
+
+from sankaku import constants as const, errors
+from sankaku.clients import HttpClient, HttpCache, SqliteHttpCache
+from sankaku.models.http import ClientResponse, Endpoints
+from sankaku.utils import RateLimiter, ModelCache
+
+
+__all__ = ["CachingProxy", "main"]
+
+
+class CachingProxy:
+    def __init__(
+        self,
+        *,
+        ratelimiter: Optional[RateLimiter] = None,
+        cache: Optional[HttpCache] = None,
+        ttl: float = const.BASE_PROXY_TTL,
+        maxsize: int = 10_000,
+        endpoints: Optional[Endpoints] = None
+    ) -> None:
+        """Server that forwards requests to Sankaku API under the same paths.
+        Clients pointed at it (see `Endpoints`) share its
+        rate limit budget, cache and coalescing of identical requests (see
+        `HttpClient`).
+
+        Args:
+            ratelimiter: Limiter shared by all forwarded requests
+            cache: Persistent storage of API responses revalidated by
+                conditional requests
+            ttl: Time in seconds to serve successful GET responses from
+                memory without forwarding requests
+            maxsize: Maximum number of responses kept in memory
+            endpoints: Base urls of upstream servers (by default Sankaku ones)
+        """
+        self.ratelimiter = ratelimiter
+        self.cache = cache
+        self.responses = ModelCache(maxsize, ttl={"response": ttl})
+        self.endpoints = endpoints
+        self.http_client: Optional[HttpClient] = None
+
+    def create_app(self) -> web.Application:
+        """Create application serving proxy."""
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", self.handle)
+        app.on_startup.append(self._start)
+        app.on_cleanup.append(self._stop)
+        return app
+
+    async def _start(self, app: web.Application) -> None:  # noqa: ARG002
+        self.http_client = HttpClient(
+            ratelimiter=self.ratelimiter,
+            cache=self.cache,
+            endpoints=self.endpoints
+        )
+
+    async def _stop(self, app: web.Application) -> None:  # noqa: ARG002
+        if self.http_client is not None:
+            await self.http_client.close()
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Forward request to Sankaku API or serve response from memory."""
+        authorization = request.headers.get("authorization")
+        key = (request.path_qs, authorization)
+        if request.method == "GET":
+            response = self.responses.get("response", key)
+            if response is not None:
+                return _make_response(response)
+
+        headers = self.http_client.headers.copy()  # type: ignore[union-attr]
+        if authorization is not None:
+            headers["authorization"] = authorization
+        try:
+            response = await self.http_client.request(  # type: ignore[union-attr]
+                request.method,
+                f"{const.API_URL}{request.path}",
+                params=list(request.query.items()),
+                data=await request.read() or None,
+                headers=headers
+            )
+        except (errors.SankakuServerError, ClientError) as e:
+            logger.warning(f"Failed to forward request to {request.path_qs}: {e}")
+            return web.Response(status=502, text=str(e))
+
+        if request.method == "GET" and response.ok:
+            self.responses.put("response", key, response)
+        return _make_response(response)
+
+
+def _make_response(response: ClientResponse) -> web.Response:
+    return web.Response(
+        status=response.status,
+        body=response.content,
+        content_type="application/json"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run caching proxy with arguments from command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m sankaku.proxy",
+        description="Caching proxy of Sankaku API shared by several clients."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument(
+        "--upstream",
+        default=const.API_URL,
+        help="base url of upstream API (e.g. url of mirror)"
+    )
+    parser.add_argument("--port", type=int, default=const.BASE_PROXY_PORT)
+    parser.add_argument("--rps", type=float, default=const.BASE_RPS)
+    parser.add_argument("--burst", type=int, default=const.BASE_BURST)
+    parser.add_argument(
+        "--cache",
+        help="path to SQLite database of persistent HTTP cache"
+    )
+    parser.add_argument(
+        "--ttl",
+        type=float,
+        default=const.BASE_PROXY_TTL,
+        help="time in seconds to serve responses from memory"
+    )
+    args = parser.parse_args(argv)
+
+    proxy = CachingProxy(
+        ratelimiter=RateLimiter(rps=args.rps, burst=args.burst),
+        cache=SqliteHttpCache(args.cache) if args.cache else None,
+        ttl=args.ttl,
+        endpoints=Endpoints(api_url=args.upstream)
+    )
+    web.run_app(proxy.create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    # Logs of library are disabled by default. Proxy run as a script shows
+    # them without debug messages, which would decode every response.
+    logger.remove()
+    logger.add(sys.stderr, level="INFO")
+    logger.enable("sankaku")
+    main()
@@ -1,5 +1,8 @@
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Optional, List
+
+from sankaku import constants as const
 
 try:
     from typing import TypedDict
@@ -7,7 +10,14 @@ except (ImportError, ModuleNotFoundError):
     from typing_extensions import TypedDict
 
 
-__all__ = ["ValueRange", "Timestamp"]
+__all__ = [
+    "ValueRange",
+    "Timestamp",
+    "DatePartition",
+    "IdPartition",
+    "Watermark",
+    "DownloadStats"
+]
 
 
 @dataclass(frozen=True)
@@ -20,3 +30,95 @@ class Timestamp(TypedDict):
     json_class: str
     s: Optional[int]
     n: int
+
+
+@dataclass(frozen=True)
+class DatePartition:
+    """Split of search into shards covering equal intervals of upload dates."""
+    start: datetime
+    end: datetime
+    shards: int
+
+    def __post_init__(self) -> None:
+        if self.shards < 1 or self.start >= self.end:
+            raise ValueError("Partition must contain at least one shard.")
+
+    def tags(self) -> List[str]:
+        """Get search tags that select items of each shard."""
+        step = (self.end - self.start) / self.shards
+        bounds = [
+            (self.start + step*i).replace(second=0, microsecond=0)
+            for i in range(self.shards)
+        ]
+        bounds.append(self.end)
+        # Date ranges are inclusive and have minute precision, so shard ends
+        # are shifted back to avoid overlapping of neighbour shards.
+        return [
+            "date:{}..{}".format(
+                start.strftime(const.DATE_FORMAT),
+                (end - timedelta(minutes=1)).strftime(const.DATE_FORMAT)
+            )
+            for start, end in zip(bounds, bounds[1:])
+            if start < end
+        ]
+
+
+@dataclass(frozen=True)
+class IdPartition:
+    """Split of search into shards covering equal ranges of item IDs."""
+    start: int
+    end: int
+    shards: int
+
+    def __post_init__(self) -> None:
+        if self.shards < 1 or self.start >= self.end:
+            raise ValueError("Partition must contain at least one shard.")
+
+    def tags(self) -> List[str]:
+        """Get search tags that select items of each shard."""
+        size = -(-(self.end - self.start) // self.shards)
+        return [
+            f"id_range:{start}..{min(start + size, self.end) - 1}"
+            for start in range(self.start, self.end, size)
+        ]
+
+
+@dataclass
+class Watermark:
+    """Position of the newest item seen by incremental browsing. It's updated
+    in place every time browsing is completed.
+    """
+    id: Optional[int] = None
+    created_at: Optional[datetime] = None
+
+    def is_reached(self, item_id: int, created_at: Optional[datetime]) -> bool:
+        """Check whether item with given ID and creation date is already seen."""
+        if self.id is not None and item_id <= self.id:
+            return True
+        elif self.created_at is not None and created_at is not None:
+            # Naive datetime is considered to be in local timezone.
+            return created_at <= self.created_at.astimezone()
+        return False
+
+
+@dataclass
+class DownloadStats:
+    """Statistics of downloading of media files.
+
+    Attributes:
+        files: Number of downloaded files
+        skipped: Number of files skipped because they are already present
+        failed: Number of files that failed to download or have no url
+        size: Number of downloaded bytes
+        seconds: Time spent on downloading
+    """
+    files: int = 0
+    skipped: int = 0
+    failed: int = 0
+    size: int = 0
+    seconds: float = 0
+
+    @property
+    def throughput(self) -> float:
+        """Average download speed in bytes per second."""
+        return self.size / self.seconds if self.seconds else 0
@@ -1,22 +1,366 @@
 """Miscellaneous support functions that are used at different places."""
 
 import asyncio
+import base64
+import time
+import zlib
+from collections import deque, OrderedDict
 from datetime import datetime
 from functools import wraps
-from typing import TypeVar, Optional, Callable, Awaitable
+from http import HTTPStatus
+from typing import (
+    TypeVar,
+    Optional,
+    Callable,
+    Awaitable,
+    Deque,
+    Mapping,
+    Hashable,
+    Tuple,
+    Any
+)
 
+from loguru import logger
 from typing_extensions import ParamSpec
 
+from sankaku import constants as const
 from sankaku.errors import RateLimitError
 from sankaku.typedefs import Timestamp
 
 
-__all__ = ["ratelimit", "convert_ts_to_datetime"]
+__all__ = [
+    "RateLimiter",
+    "AdaptiveRateLimiter",
+    "SeenIds",
+    "ModelCache",
+    "ratelimit",
+    "convert_ts_to_datetime"
+]
 
 _T = TypeVar("_T")
 _P = ParamSpec("_P")
 
 
+class RateLimiter:
+    def __init__(
+        self,
+        *,
+        rps: Optional[float] = None,
+        rpm: Optional[float] = None,
+        burst: int = 1
+    ) -> None:
+        """Token bucket limiter of the number of requests. Instance can be
+        shared between several clients to keep them all within the same budget.
+
+        Args:
+            rps: Requests per second
+            rpm: Requests per minute
+            burst: Maximum number of requests that can be sent at once after
+                being idle
+        """
+        if rps and rpm:
+            raise RateLimitError
+        elif not rps and not rpm:
+            raise TypeError("At least one argument must be specified.")
+        elif burst < 1:
+            raise ValueError("Burst size must be at least 1.")
+
+        self.rate: float = rps or rpm / 60  # type: ignore
+        self.burst = burst
+        self._tokens: float = burst
+        self._updated = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        """Number of requests that can be sent right now without waiting."""
+        self._refill()
+        return max(self._tokens, 0)
+
+    async def acquire(self) -> None:
+        """Wait until request is allowed to be sent."""
+        self._refill()
+        # Token is reserved before suspending, so concurrent callers are
+        # queued one after another. Negative balance is a debt that will be
+        # covered by the following refills.
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+    def feedback(
+        self,
+        status: Optional[int],  # noqa: ARG002
+        latency: float,  # noqa: ARG002
+        retry_after: Optional[float] = None
+    ) -> None:
+        """Report result of request previously allowed by `acquire()`.
+
+        Args:
+            status: Response status or None if request failed without response
+            latency: Time in seconds elapsed until response was received
+            retry_after: Delay in seconds requested by server
+        """
+        if retry_after:
+            self.pause(retry_after)
+
+    def pause(self, delay: float) -> None:
+        """Suspend sending of further requests for specified number of seconds."""
+        self._refill()
+        self._tokens = min(self._tokens, -delay * self.rate)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst,
+            self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    def __init__(
+        self,
+        *,
+        rps: Optional[float] = None,
+        rpm: Optional[float] = None,
+        burst: int = 1,
+        min_rps: float = 0.5,
+        max_rps: float = 10,
+        concurrency: int = 1,
+        max_concurrency: int = 8,
+        rate_step: float = 0.05,
+        backoff: float = 0.5,
+        target_latency: float = 1
+    ) -> None:
+        """Limiter which adjusts request rate and number of concurrent requests
+        according to additive-increase/multiplicative-decrease rule. Limits
+        grow while responses stay successful and faster than target latency,
+        and are cut on 429 and 5xx responses.
+
+        Args:
+            rps: Initial requests per second
+            rpm: Initial requests per minute
+            burst: Maximum number of requests that can be sent at once after
+                being idle
+            min_rps: Lower bound of request rate
+            max_rps: Upper bound of request rate
+            concurrency: Initial number of requests allowed to be in flight
+            max_concurrency: Upper bound of requests allowed to be in flight
+            rate_step: Increase of request rate after each fast response
+            backoff: Factor applied to limits after throttling response
+            target_latency: Response time in seconds treated as fast
+        """
+        super().__init__(rps=rps, rpm=rpm, burst=burst)
+        if not 0 < backoff < 1:
+            raise ValueError("Backoff factor must be between 0 and 1.")
+
+        self.min_rate = min_rps
+        self.max_rate = max_rps
+        self.max_concurrency = max_concurrency
+        self.rate_step = rate_step
+        self.backoff = backoff
+        self.target_latency = target_latency
+        self.rate = min(max(self.rate, min_rps), max_rps)
+
+        # Concurrency limit is kept fractional to grow it by 1/limit per
+        # response, so it increases by about one per fully successful window.
+        self._concurrency = float(min(concurrency, max_concurrency))
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def concurrency(self) -> int:
+        """Current number of requests allowed to be in flight."""
+        return max(int(self._concurrency), 1)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests that are in flight right now."""
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait until request is allowed to be sent."""
+        while self._in_flight >= self.concurrency:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self._in_flight += 1
+
+        try:
+            await super().acquire()
+        except BaseException:
+            self._release()
+            raise
+
+    def feedback(
+        self,
+        status: Optional[int],
+        latency: float,
+        retry_after: Optional[float] = None
+    ) -> None:
+        """Report result of request previously allowed by `acquire()`.
+        Each call to `acquire()` must be followed by exactly one call of
+        this method.
+
+        Args:
+            status: Response status or None if request failed without response
+            latency: Time in seconds elapsed until response was received
+            retry_after: Delay in seconds requested by server
+        """
+        self._release()
+        if (
+            retry_after
+            or status is None
+            or status == HTTPStatus.TOO_MANY_REQUESTS
+            or status >= HTTPStatus.INTERNAL_SERVER_ERROR
+        ):
+            self._decrease()
+        elif latency <= self.target_latency:
+            self._increase()
+        super().feedback(status, latency, retry_after)
+
+    def _increase(self) -> None:
+        self._refill()
+        self.rate = min(self.rate + self.rate_step, self.max_rate)
+        self._concurrency = min(
+            self._concurrency + 1 / self._concurrency,
+            self.max_concurrency
+        )
+        self._wake_up()
+
+    def _decrease(self) -> None:
+        self._refill()
+        self.rate = max(self.rate * self.backoff, self.min_rate)
+        self._concurrency = max(self._concurrency * self.backoff, 1)
+        logger.debug(
+            f"Request limits decreased to {self.rate:.2f} rps "
+            f"and {self.concurrency} concurrent requests"
+        )
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake_up()
+
+    def _wake_up(self) -> None:
+        free_slots = self.concurrency - self._in_flight
+        for waiter in list(self._waiters):
+            if free_slots <= 0:
+                break
+            if not waiter.done():
+                waiter.set_result(None)
+                free_slots -= 1
+
+
+class SeenIds:
+    def __init__(self) -> None:
+        """Compact set of non-negative integer IDs, stored as a bitset.
+        It takes one bit per each ID up to the largest added one (e.g. 5 MB for
+        IDs up to 40 millions) and, unlike probabilistic structures, never
+        reports unseen ID as a seen one.
+        """
+        self._bits = bytearray()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, item_id: int) -> bool:
+        index = item_id >> 3
+        return index < len(self._bits) and bool(self._bits[index] >> (item_id & 7) & 1)
+
+    def add(self, item_id: int) -> bool:
+        """Add ID to the set.
+
+        Returns:
+            Whether ID was not in the set before
+        """
+        index = item_id >> 3
+        if index >= len(self._bits):
+            # Grow at least twice to make reallocations rare.
+            self._bits.extend(bytes(max(index + 1 - len(self._bits), len(self._bits))))
+
+        mask = 1 << (item_id & 7)
+        if self._bits[index] & mask:
+            return False
+        self._bits[index] |= mask
+        self._size += 1
+        return True
+
+    def dump(self) -> str:
+        """Dump IDs into compressed string that can be stored in JSON."""
+        return base64.b64encode(zlib.compress(self._bits)).decode()
+
+    @classmethod
+    def load(cls, data: str) -> "SeenIds":
+        """Load IDs from string made by `dump()`."""
+        seen = cls()
+        seen._bits = bytearray(zlib.decompress(base64.b64decode(data)))
+        seen._size = bin(int.from_bytes(seen._bits, "little")).count("1")
+        return seen
+
+
+class ModelCache:
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl: Optional[Mapping[str, float]] = None
+    ) -> None:
+        """Bounded in-memory cache of models returned by single-item getters
+        (e.g. `get_post()` and `get_tag()`). Models expire after time to live
+        of their kind, and least recently used models are evicted when cache
+        is full. Note that cached models must not be modified.
+
+        Args:
+            maxsize: Maximum number of cached models
+            ttl: Time to live in seconds of certain kinds of models ("post",
+                "ai_post", "tag", "book" or "user") that overrides default one
+                (see `constants.CACHE_TTL`). Zero disables caching of the kind
+        """
+        self.maxsize = maxsize
+        self.ttl = {**const.CACHE_TTL, **(ttl or {})}
+        self.hits = 0
+        self.misses = 0
+        self._items: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, kind: str, key: Hashable) -> Optional[Any]:
+        """Get cached model of certain kind by its key (e.g. ID or name).
+
+        Returns:
+            Cached model or `None` if it is missing or expired
+        """
+        entry = self._items.get((kind, key))
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._items[kind, key]
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._items.move_to_end((kind, key))
+        return entry[1]
+
+    def put(self, kind: str, key: Hashable, model: Any) -> None:
+        """Cache model of certain kind by its key (e.g. ID or name)."""
+        ttl = self.ttl.get(kind)
+        if not ttl:
+            return
+
+        self._items[kind, key] = (time.monotonic() + ttl, model)
+        self._items.move_to_end((kind, key))
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached models."""
+        self._items.clear()
+
+
 def ratelimit(
         *,
         rps: Optional[int] = None,
@@ -24,21 +368,19 @@ def ratelimit(
 ) -> Callable[[Callable[_P, Awaitable[_T]]], Callable[_P, Awaitable[_T]]]:
     """Limit the number of requests.
 
+    Calls of decorated function share one `RateLimiter` without bursts, so
+    the limit is respected even if the function is awaited concurrently.
+
     Args:
         rps: Request per second
         rpm: Requests per minute
     """
-    if all(locals().values()):
-        raise RateLimitError
-    elif not any(locals().values()):
-        raise TypeError("At least one argument must be specified.")
-
-    sleep_time: float = (1 / rps) if rps else (60 / rpm)  # type: ignore
+    limiter = RateLimiter(rps=rps, rpm=rpm)
 
     def wrapper(func: Callable[_P, Awaitable[_T]]) -> Callable[_P, Awaitable[_T]]:
         @wraps(func)
         async def inner(*args: _P.args, **kwargs: _P.kwargs) -> _T:
-            await asyncio.sleep(sleep_time)
+            await limiter.acquire()
             return await func(*args, **kwargs)
 
         return inner
@@ -1,9 +1,172 @@
 import os
+import json
 import asyncio
+from typing import Any, Callable, Collection, Dict, List, Optional
 
 import pytest
 
 from sankaku.clients import SankakuClient
+from sankaku.models.http import ClientResponse
+
+
+def post(item_id: int) -> Dict[str, Any]:
+    """Raw data of post containing only ID and creation date."""
+    created_at = {"json_class": "Time", "s": 1_600_000_000 + item_id}
+    return {"id": item_id, "created_at": created_at}
+
+
+def author(item_id: int) -> Dict[str, Any]:
+    """Raw data of author named after its ID."""
+    return {"id": item_id, "name": str(item_id), "avatar": "", "avatar_rating": "s"}
+
+
+def comment(item_id: int) -> Dict[str, Any]:
+    """Raw data of comment without replies."""
+    return {
+        "id": item_id,
+        "created_at": "2020-01-01T00:00:00+00:00",
+        "post_id": 1,
+        "author": author(1),
+        "body": "",
+        "score": 0,
+        "parent_id": None,
+        "children": [],
+        "deleted": False,
+        "deleted_by": {},
+        "updated_at": None,
+        "can_reply": True,
+        "reason": None
+    }
+
+
+class FakeResponse:
+    """Stub of aiohttp response served from memory."""
+
+    def __init__(
+        self,
+        status: int,
+        content: bytes = b"",
+        headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        self.status = status
+        self.ok = status < 400  # noqa: PLR2004
+        self.headers = headers or {}
+        self.content_type = "application/json"
+        self.url = ""
+        self.content = content
+
+    async def read(self) -> bytes:  # noqa: D102
+        return self.content
+
+    def close(self) -> None:  # noqa: D102
+        pass
+
+
+class FakeHttpClient:
+    def __init__(
+        self,
+        items: int,
+        *,
+        item: Callable[[int], Dict[str, Any]] = lambda item_id: {"id": item_id},
+        shift: int = 0,
+        cursor: bool = False,
+        hidden: Collection[int] = (),
+        delay: float = 0
+    ) -> None:
+        """HTTP client stub that serves items (newest first) without network
+        access. Searches (requests with params) return pages of items filtered
+        by `id:` and `id_range:` tags and continued from `next` cursor if it's
+        present. Other requests return single item by ID at the end of URL.
+
+        Args:
+            items: Number of items with IDs from 1 to this number
+            item: Function making raw data of item by its ID
+            shift: Number of items uploaded (if positive) or deleted (if
+                negative) after each served page, except for `id_range` searches
+            cursor: Whether to wrap pages into envelope with cursor of the
+                next page
+            hidden: IDs of items that are not found by searches
+            delay: Time of each response in seconds
+        """
+        self.ids = list(range(items, 0, -1))
+        self.item = item
+        self.shift = shift
+        self.cursor = cursor
+        self.hidden = hidden
+        self.delay = delay
+        # Params of served searches and IDs of served single items
+        self.requested: List[Dict[str, str]] = []
+        self.fetched: List[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, url: str, **kwargs) -> ClientResponse:  # noqa: D102
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        if "params" not in kwargs:
+            return self._fetch(url)
+        return self._search(kwargs["params"])
+
+    def _fetch(self, url: str) -> ClientResponse:
+        item_id = int(url.rsplit("/", 1)[1])
+        self.fetched.append(item_id)
+        if item_id not in self.ids:
+            return ClientResponse(404, False, content=b"{}")
+        return ClientResponse(
+            200, True, content=json.dumps(self.item(item_id)).encode()
+        )
+
+    def _search(self, params: Dict[str, str]) -> ClientResponse:
+        self.requested.append(params)
+        ids = self.ids
+        tags = params.get("tags", "").split()
+        for tag in tags:
+            if tag.startswith("id:"):
+                found = {int(i) for i in tag[len("id:"):].split(",")}
+                ids = [i for i in ids if i in found and i not in self.hidden]
+            elif tag.startswith("id_range:<"):
+                last_id = int(tag[len("id_range:<"):])
+                ids = [i for i in ids if i < last_id]
+            elif tag.startswith("id_range:"):
+                low, high = map(int, tag[len("id_range:"):].split(".."))
+                ids = [i for i in ids if low <= i <= high]
+
+        limit = int(params["limit"])
+        if "next" in params:
+            start = int(params["next"])
+        else:
+            start = (int(params.get("page", "1")) - 1) * limit
+        stop = start + limit
+        data = [self.item(i) for i in ids[start:stop]]
+
+        if not any(tag.startswith("id_range:") for tag in tags):
+            if self.shift > 0:
+                top = self.ids[0] if self.ids else 0
+                self.ids = [*range(top + self.shift, top, -1), *self.ids]
+            elif self.shift < 0:
+                self.ids = self.ids[-self.shift:]
+
+        if self.cursor:
+            next_cursor = str(stop) if stop < len(ids) else None
+            body: Any = {"meta": {"next": next_cursor, "prev": None}, "data": data}
+        else:
+            body = data
+        return ClientResponse(200, True, content=json.dumps(body).encode())
+
+
+async def make_client(http_client: FakeHttpClient, **kwargs: Any) -> SankakuClient:
+    """Client that sends requests through HTTP client stub. Its own HTTP client
+    is closed, so that its sessions aren't left unclosed.
+    """
+    client = SankakuClient(**kwargs)
+    await client._http_client.close()
+    client._http_client = http_client  # type: ignore
+    return client
 
 
 @pytest.fixture(scope="session")
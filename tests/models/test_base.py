@@ -0,0 +1,152 @@
+import pytest
+
+from sankaku.models import PostTag, Wiki, Comment
+from sankaku.models.base import Interner
+
+
+def _comment(comment_id: int, children: list) -> dict:
+    return {
+        "id": comment_id,
+        "created_at": "2023-04-16T19:03:19.300Z",
+        "post_id": 12345,
+        "author": {
+            "id": 99123,
+            "name": "abcdef",
+            "avatar": "",
+            "avatar_rating": "q"
+        },
+        "body": "Hello, World!",
+        "score": 3,
+        "parent_id": None,
+        "children": children,
+        "deleted": False,
+        "deleted_by": {},
+        "updated_at": None,
+        "can_reply": True,
+        "reason": None
+    }
+
+
+@pytest.mark.parametrize(
+    ["model", "data"],
+    [
+        (
+            PostTag,
+            {
+                "id": 1129497,
+                "name_en": "hololive",
+                "name_ja": "ホロライブ",
+                "type": 3,
+                "count": 182184,
+                "post_count": 182184,
+                "pool_count": 549,
+                "series_count": 0,
+                "locale": "en",
+                "rating": "s",
+                "version": 1,
+                "tagName": "hololive",
+                "total_post_count": 182184,
+                "total_pool_count": 549,
+                "name": "hololive"
+            }
+        ),
+        (
+            Wiki,
+            {
+                "id": 1,
+                "title": "hololive",
+                "body": "Virtual YouTuber agency.",
+                "created_at": {"json_class": "Time", "s": 1680471860, "n": 0},
+                "updated_at": {"json_class": "Time", "s": None, "n": 0},
+                "user": {
+                    "id": 2,
+                    "name": "anonymous",
+                    "avatar": "URL",
+                    "avatar_rating": "s"
+                },
+                "is_locked": False,
+                "version": 3
+            }
+        ),
+        (Comment, _comment(1, [_comment(2, [])]))
+    ]
+)
+def test_construct_trusted(model, data):  # noqa: D103
+    assert model.construct_trusted(data) == model(**data)
+
+
+def test_construct_trusted_ignores_unknown_keys():  # noqa: D103
+    tag = PostTag.construct_trusted({"id": 1, "name": "tag", "unknown": True})
+
+    assert tag.id == 1
+    assert tag.name == "tag"
+    assert not hasattr(tag, "unknown")
+    assert tag.model_fields_set == {"id", "name"}
+
+
+def test_construct_trusted_leaves_missing_fields_unset():  # noqa: D103
+    tag = PostTag.construct_trusted({"id": 1})
+
+    with pytest.raises(AttributeError):
+        tag.name
+
+
+def test_project():  # noqa: D103
+    model = Wiki.project(["id", "created_at", "author.name"])
+    wiki = model(
+        id=1,
+        title="ignored",
+        created_at={"json_class": "Time", "s": 1680471860, "n": 0},
+        user={"id": 2, "name": "anonymous", "avatar": "URL", "avatar_rating": "s"}
+    )
+
+    assert list(model.model_fields) == ["id", "created_at", "author"]
+    assert wiki.created_at == Wiki.normalize_datetime(
+        {"json_class": "Time", "s": 1680471860, "n": 0}
+    )
+    assert wiki.author.model_dump() == {"name": "anonymous"}
+    assert Wiki.project(["author.name", "created_at", "id"]) is model
+
+
+@pytest.mark.parametrize(["fields"], [(["unknown"],), (["id.value"],)])
+def test_project_with_invalid_fields(fields):  # noqa: D103
+    with pytest.raises(ValueError):
+        Wiki.project(fields)
+
+
+def test_lazy():  # noqa: D103
+    data = _comment(1, [_comment(2, [])])
+    model = Comment.lazy()
+    comment = model(**data)
+
+    assert isinstance(comment, Comment)
+    assert model.__lazy_fields__ == {"children"}
+    assert comment.model_dump() == Comment(**data).model_dump()
+
+    child = comment.children[0]
+    assert isinstance(child, model)
+    assert child.id == 2  # noqa: PLR2004
+    assert comment.children[0] is child
+
+
+def test_lazy_without_nested_collections():  # noqa: D103
+    assert PostTag.lazy() is PostTag
+
+
+def test_interner():  # noqa: D103
+    interner = Interner()
+    comment = interner.intern(Comment(**_comment(1, [_comment(2, [])])))
+    other = interner.intern(Comment(**_comment(3, [])))
+
+    assert comment.author is comment.children[0].author
+    assert comment.author is other.author
+    assert (interner.hits, interner.misses) == (2, 1)
+
+
+def test_interner_evicts_least_recently_used():  # noqa: D103
+    interner = Interner(maxsize=1)
+    first = interner.intern(Comment(**_comment(1, [])).author)
+    interner.intern(first.model_copy(update={"id": 2}))
+
+    assert len(interner) == 1
+    assert interner.intern(first.model_copy()) is not first
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from sankaku import constants as const
+from sankaku.models.http import ClientResponse, Endpoints
+
+
+def test_client_response_decodes_json_lazily():  # noqa: D103
+    calls = []
+
+    def loads(content: bytes):
+        calls.append(content)
+        return json.loads(content)
+
+    response = ClientResponse(200, True, content=b'{"id": 1}', loads=loads)
+    assert not calls
+
+    assert response.json == {"id": 1}
+    assert response.json == {"id": 1}
+    assert len(calls) == 1
+
+
+def test_client_response_with_empty_body():  # noqa: D103
+    assert ClientResponse(204, True).json is None
+
+
+@pytest.mark.parametrize(
+    ["endpoints", "url", "expected"],
+    [
+        (Endpoints(), const.POSTS_URL, const.POSTS_URL),
+        (
+            Endpoints(api_url="http://localhost:8080/"),
+            const.POST_URL.format(post_id=1),
+            "http://localhost:8080/posts/1"
+        ),
+        (
+            Endpoints(login_url="http://localhost:8080"),
+            const.LOGIN_URL,
+            "http://localhost:8080/auth/token"
+        ),
+        (
+            Endpoints(api_url="http://localhost:8080"),
+            "https://example.com",
+            "https://example.com"
+        )
+    ]
+)
+def test_endpoints_resolve(endpoints, url, expected):  # noqa: D103
+    assert endpoints.resolve(url) == expected
+
+
+def test_endpoints_host_header():  # noqa: D103
+    assert Endpoints().host_header == const.HEADERS["host"]
+    assert Endpoints(api_url="http://localhost:8080").host_header == "localhost:8080"
+    assert Endpoints(host="mirror").host_header == "mirror"
+
+
+def test_client_response_with_decoded_json():  # noqa: D103
+    response = ClientResponse(200, True, [{"id": 1}])
+
+    assert response.json == [{"id": 1}]
+    assert response.content == b""
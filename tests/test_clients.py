@@ -1,9 +1,167 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
 from datetime import datetime
 
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from sankaku import errors, models as mdl, types
-from sankaku.clients import SankakuClient
+from sankaku.clients import SankakuClient, HttpClient, SqliteHttpCache
+from sankaku.clients.clients import (
+    _process_page_range,
+    _compute_slice,
+    _slice_items
+)
+from sankaku.paginators import Paginator
+from sankaku.models.http import CachedResponse, ClientResponse, PoolConfig
+from sankaku.typedefs import IdPartition
+from sankaku.utils import ModelCache, RateLimiter
+from tests.conftest import (
+    FakeHttpClient,
+    FakeResponse,
+    author,
+    comment,
+    make_client
+)
+
+
+class TestHttpClient:
+    async def test_pool_config(self):  # noqa: D102
+        http_client = HttpClient(
+            pool=PoolConfig(limit=5, limit_per_host=2),
+            media_pool=PoolConfig(limit=50)
+        )
+
+        assert http_client._client_session.connector.limit == 5  # noqa: PLR2004
+        assert http_client._client_session.connector.limit_per_host == 2  # noqa: PLR2004
+        assert http_client.media_session.connector.limit == 50  # noqa: PLR2004
+        assert http_client.media_session is not http_client._client_session
+        await http_client.close()
+
+    async def test_close(self):  # noqa: D102
+        http_client = HttpClient()
+        media_session = http_client.media_session
+
+        await http_client.close()
+
+        assert http_client._client_session.closed
+        assert media_session.closed
+
+    @pytest.mark.parametrize(["coalesce", "expected"], [(True, 3), (False, 5)])
+    async def test_coalesce(self, monkeypatch, coalesce, expected):  # noqa: D102
+        http_client = HttpClient(coalesce=coalesce)
+        sent = []
+
+        async def request(method: str, url: str, **kwargs) -> ClientResponse:  # noqa: ARG001
+            sent.append((method, url))
+            await asyncio.sleep(0.01)
+            return ClientResponse(200, True, content=b"{}")
+
+        monkeypatch.setattr(http_client, "_request", request)
+        cancelled = asyncio.ensure_future(http_client.get("a"))
+        requests = [
+            asyncio.ensure_future(coroutine)
+            for coroutine in [
+                http_client.get("a"),
+                http_client.get("a"),
+                http_client.get("a", params={"page": 2}),
+                http_client.post("a")
+            ]
+        ]
+        await asyncio.sleep(0)
+        # Request goes on for the rest of its waiters.
+        cancelled.cancel()
+        responses = await asyncio.gather(*requests)
+        await http_client.close()
+
+        assert len(sent) == expected
+        assert (responses[0] is responses[1]) is coalesce
+        assert not http_client._in_flight
+
+    @pytest.mark.parametrize(["coalesce"], [(True,), (False,)])
+    async def test_close_paginator_with_prefetch(self, monkeypatch, coalesce):  # noqa: D102
+        http_client = HttpClient(
+            ratelimiter=RateLimiter(rps=10, burst=1),
+            coalesce=coalesce
+        )
+        sent = []
+
+        async def request(method: str, url: str, **kwargs) -> FakeResponse:  # noqa: ARG001
+            sent.append(kwargs["params"]["page"])
+            await asyncio.sleep(0.01)
+            return FakeResponse(200, json.dumps([author(1)]).encode())
+
+        monkeypatch.setattr(http_client.session, "request", request)
+        async with Paginator(
+            10,
+            http_client=http_client,
+            url="",
+            model=mdl.Author,
+            prefetch=6
+        ) as paginator:
+            await paginator.__anext__()
+        # Prefetched pages wait for the rate limiter and are cancelled before
+        # they are sent.
+        await asyncio.sleep(0.3)
+        await http_client.close()
+
+        assert sent == ["1"]
+        assert not http_client._in_flight
+
+    async def test_cache(self, monkeypatch, tmp_path):  # noqa: D102
+        sent = []
+
+        async def request(method: str, url: str, **kwargs) -> FakeResponse:  # noqa: ARG001
+            sent.append(kwargs["headers"].get("If-None-Match"))
+            if kwargs["headers"].get("If-None-Match") == '"1"':
+                return FakeResponse(304)
+            return FakeResponse(200, b'{"id": 1}', headers={"ETag": '"1"'})
+
+        responses = []
+        for _ in range(2):
+            # Cache is opened again to check that it survives restarts.
+            http_client = HttpClient(cache=SqliteHttpCache(tmp_path / "cache.db"))
+            monkeypatch.setattr(http_client.session, "request", request)
+            responses.append(await http_client.get("a", params={"page": 1}))
+            await http_client.close()
+
+        assert sent == [None, '"1"']
+        assert [response.json for response in responses] == [{"id": 1}] * 2
+        assert responses[1].status == 200  # noqa: PLR2004
+
+    async def test_cache_locked(self, monkeypatch, tmp_path):  # noqa: D102
+        cache = SqliteHttpCache(tmp_path / "cache.db", timeout=0)
+        http_client = HttpClient(cache=cache)
+
+        async def request(method: str, url: str, **kwargs) -> FakeResponse:  # noqa: ARG001
+            return FakeResponse(200, b'{"id": 1}', headers={"ETag": '"1"'})
+
+        monkeypatch.setattr(http_client.session, "request", request)
+        # Another process holds write lock of database.
+        other = sqlite3.connect(tmp_path / "cache.db", isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        response = await http_client.get("a")
+        other.close()
+        await http_client.close()
+
+        assert response.json == {"id": 1}
+        assert len(cache) == 0
+
+    def test_cache_max_entries(self, tmp_path):  # noqa: D102
+        cache = SqliteHttpCache(tmp_path / "cache.db", max_entries=10)
+        response = CachedResponse(200, b"{}", '"1"', None)
+        for key in range(25):
+            cache.save(str(key), response)
+        # Response saved again becomes the newest one.
+        cache.save("0", response)
+
+        assert len(cache) <= 11  # noqa: PLR2004
+        assert cache.get("0") == response
+        assert cache.get("24") == response
+        assert cache.get("1") is None
 
 
 class TestBaseClient:
@@ -33,6 +191,10 @@ class TestPostClient:
         """Default behaviour when unauthorized user don't set any arguments."""
         assert isinstance(await nlclient.browse_posts(1).__anext__(), mdl.Post)
 
+    async def test_browse_with_limit(self, nlclient: SankakuClient):  # noqa: D102
+        posts = [post async for post in nlclient.browse_posts(90, 150, limit=100)]
+        assert len(posts) == 60  # noqa: PLR2004
+
     @pytest.mark.parametrize(
         ["file_type", "video_duration", "expected"],
         [(types.FileType.IMAGE, [1, 60], errors.VideoDurationError)]
@@ -376,3 +538,176 @@ class TestUserClient:
     ):
         with pytest.raises(errors.PageNotFoundError):
             await nlclient.get_user(name_or_id)
+
+
+@pytest.mark.parametrize(
+    ["item_range", "limit"],
+    [((1, 250, 1), 40), ((5, 233, 3), 100), ((7, 400, 41), 40), ((3, 10, 2), 1)]
+)
+def test_compute_slice(item_range, limit):  # noqa: D103
+    page_range = _process_page_range(*item_range[:2], limit=limit)
+    items = []
+    for page_number in range(*page_range):
+        page = list(range(page_number * limit, (page_number + 1) * limit))
+        items.extend(page[_compute_slice(item_range, page_number, limit=limit)])
+
+    assert items == list(range(*item_range))
+
+
+async def test_browse_posts_with_partition():  # noqa: D103
+    client = await make_client(FakeHttpClient(30))
+
+    posts = client.browse_posts(
+        2, 25, 2,
+        limit=4,
+        fields=["id"],
+        partition=IdPartition(1, 31, shards=3)
+    )
+
+    assert [post.id async for post in posts] == list(range(28, 5, -2))
+
+
+async def test_browse_posts_with_partition_overlaps_shards():  # noqa: D103
+    http_client = FakeHttpClient(30, delay=0.05)
+    client = await make_client(http_client)
+
+    posts = client.browse_posts(
+        30,
+        limit=4,
+        prefetch=1,
+        fields=["id"],
+        partition=IdPartition(1, 31, shards=3)
+    )
+    first = await posts.__anext__()
+    # Each shard takes three pages, and two of them are fetched by each of
+    # the following shards while the first one is still being consumed.
+    await asyncio.sleep(0.5)
+    assert len(http_client.requested) == 3 * 2
+    assert http_client.max_in_flight == 3  # noqa: PLR2004
+
+    assert [first.id, *[post.id async for post in posts]] == list(range(30, 0, -1))
+
+
+async def test_browse_posts_with_partition_reads_ahead_few_pages():  # noqa: D103
+    http_client = FakeHttpClient(80)
+    client = await make_client(http_client)
+
+    posts = client.browse_posts(
+        40,
+        limit=2,
+        prefetch=1,
+        fields=["id"],
+        partition=IdPartition(1, 81, shards=8)
+    )
+    ids = []
+    async for post in _slice_items(posts, (0, 3, 1)):
+        ids.append(post.id)
+        # Shards are given time to read ahead.
+        await asyncio.sleep(0.05)
+    await posts.aclose()  # type: ignore[attr-defined]
+    await asyncio.sleep(0.1)
+
+    assert ids == [80, 79, 78]
+    # Each shard has five pages, but the following shards request only two
+    # of them (one fills the queue and another one waits for free space),
+    # and shards are no longer read after the slice is returned.
+    assert len(http_client.requested) == 3 + 7 * 2
+
+
+async def test_browse_posts_with_backfill():  # noqa: D103
+    # Two of the newest posts are deleted after each page, so the rest are
+    # shifted to the previous pages.
+    client = await make_client(FakeHttpClient(30, shift=-2))
+
+    posts = client.browse_posts(30, limit=5, fields=["id"], backfill=True)
+
+    assert [post.id async for post in posts] == list(range(30, 0, -1))
+
+
+@pytest.mark.parametrize(
+    ["total", "posts", "requests"],
+    [(6, 6, 2), (None, 10, 4)]
+)
+async def test_browse_posts_with_total(total, posts, requests):  # noqa: D103
+    http_client = FakeHttpClient(10)
+    client = await make_client(http_client, cache=ModelCache())
+    # Post count of cached tag may be outdated, so it isn't used as total.
+    client._put_cached("tag", "tag", mdl.WikiTag.model_construct(post_count=6))
+
+    found = client.browse_posts(
+        30, tags=["tag"], limit=3, fields=["id"], total=total
+    )
+
+    assert len([post async for post in found]) == posts
+    assert len(http_client.requested) == requests
+
+
+@pytest.mark.parametrize(["total", "requests"], [(3, 1), (None, 2)])
+async def test_get_post_comments_with_total(total, requests):  # noqa: D103
+    http_client = FakeHttpClient(3, item=comment)
+    client = await make_client(http_client)
+
+    comments = client.get_post_comments(1, total=total)
+
+    assert [item.id async for item in comments] == [3, 2, 1]
+    assert len(http_client.requested) == requests
+
+
+async def test_get_posts():  # noqa: D103
+    http_client = FakeHttpClient(250, hidden=[7, 150])
+    client = await make_client(http_client, validation="trusted")
+
+    ids = [*range(1, 260), 1]
+    posts = [post.id async for post in client.get_posts(ids, concurrency=2)]
+
+    assert sorted(posts) == list(range(1, 251))
+    assert len(http_client.requested) == 3  # noqa: PLR2004
+    assert len(http_client.fetched) == 2 + 9
+
+
+async def test_get_post_with_cache():  # noqa: D103
+    http_client = FakeHttpClient(2)
+    client = await make_client(http_client, validation="trusted", cache=ModelCache())
+
+    posts = [await client.get_post(post_id) for post_id in (1, 2, 1)]
+
+    assert posts[0] is posts[2]
+    assert len(http_client.fetched) == 2  # noqa: PLR2004
+
+
+async def test_download_posts(tmp_path):  # noqa: D103
+    content = b"media" * 100_000
+
+    async def serve(request: web.Request) -> web.Response:  # noqa: ARG001
+        return web.Response(body=content)
+
+    app = web.Application()
+    app.router.add_get("/{name}", serve)
+    async with TestServer(app) as server:
+        posts = [
+            model.model_construct(
+                id=post_id,
+                file_url=str(server.make_url(f"/{post_id}.png?e=1")) if url else None,
+                md5=md5
+            )
+            for model, post_id, url, md5 in [
+                (mdl.Post, 1, True, hashlib.md5(content).hexdigest()),
+                (mdl.Post, 2, True, "invalid"),
+                (mdl.Post, 3, True, ""),
+                (mdl.Post, 4, False, ""),
+                (mdl.Post, 1, True, hashlib.md5(content).hexdigest()),
+                (mdl.AIPost, 1, True, hashlib.md5(content).hexdigest())
+            ]
+        ]
+        (tmp_path / "3.png").write_bytes(b"")
+        client = SankakuClient()
+        stats = await client.download_posts(posts, tmp_path, concurrency=2)
+        await client._http_client.close()
+
+    assert (stats.files, stats.skipped, stats.failed) == (2, 2, 2)
+    assert stats.size == 2 * len(content)
+    assert stats.throughput > 0
+    assert (tmp_path / "1.png").read_bytes() == content
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "1.png", "3.png", "ai_1.png"
+    ]
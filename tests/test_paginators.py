@@ -0,0 +1,377 @@
+from datetime import datetime
+
+import pytest
+
+from sankaku import errors, models as mdl, types
+from sankaku.models.base import Interner
+from sankaku.paginators import Paginator, FileCheckpointStore
+from sankaku.paginators.abc import ABCPaginator
+from sankaku.typedefs import Watermark
+from tests.conftest import FakeHttpClient, author, post
+
+
+@pytest.mark.parametrize(["prefetch"], [(1,), (3,)])
+async def test_paginator_prefetch_keeps_order(prefetch):  # noqa: D103
+    http_client = FakeHttpClient(4, item=author)
+    paginator = Paginator(
+        6,
+        http_client=http_client,  # type: ignore
+        url="",
+        model=mdl.Author,
+        limit=1,
+        prefetch=prefetch
+    )
+
+    numbers = [page.number async for page in paginator]
+
+    assert numbers == [0, 1, 2, 3]
+    assert http_client.max_in_flight <= prefetch
+
+
+async def test_paginator_close_cancels_pending_requests():  # noqa: D103
+    http_client = FakeHttpClient(10, item=author, delay=0.5)
+    async with Paginator(
+        10,
+        http_client=http_client,  # type: ignore
+        url="",
+        model=mdl.Author,
+        prefetch=4
+    ) as paginator:
+        await paginator.__anext__()
+
+    assert not paginator._pending
+    with pytest.raises(StopAsyncIteration):
+        await paginator.__anext__()
+
+
+async def test_paginator_validates_items_from_bytes():  # noqa: D103
+    paginator = Paginator(
+        1,
+        http_client=FakeHttpClient(1, item=author),  # type: ignore
+        url="",
+        model=mdl.Author
+    )
+
+    page = await paginator.__anext__()
+
+    assert page.items == [
+        mdl.Author(id=1, name="1", avatar="", avatar_rating=types.Rating.SAFE)
+    ]
+
+
+async def test_abc_paginator_without_close():  # noqa: D103
+    class SinglePagePaginator(ABCPaginator[int]):
+        def __init__(self) -> None:
+            self.returned = False
+
+        async def next_page(self) -> mdl.Page[int]:
+            if self.returned:
+                raise errors.PaginatorLastPage
+            self.returned = True
+            return mdl.Page[int](number=0, items=[1])
+
+        def complete_params(self) -> None:
+            pass
+
+    async with SinglePagePaginator() as paginator:
+        pages = [page async for page in paginator]
+
+    assert [page.items for page in pages] == [[1]]
+
+
+def test_paginator_with_invalid_prefetch():  # noqa: D103
+    with pytest.raises(ValueError):
+        Paginator(
+            1,
+            http_client=FakeHttpClient(1, item=author),  # type: ignore
+            url="",
+            model=mdl.Author,
+            prefetch=0
+        )
+
+
+async def test_paginator_with_interner():  # noqa: D103
+    interner = Interner()
+    http_client = FakeHttpClient(1, item=author)
+    pages = [
+        await Paginator(
+            1,
+            http_client=http_client,  # type: ignore
+            url="",
+            model=mdl.Author,
+            interner=interner
+        ).__anext__()
+        for _ in range(2)
+    ]
+
+    assert pages[0].items[0] is pages[1].items[0]
+
+
+@pytest.mark.parametrize(["cursor"], [(True,), (False,)])
+@pytest.mark.parametrize(
+    ["page_range", "expected"],
+    [((1, 3), [[5, 4], [3, 2]]), ((10,), [[7, 6], [5, 4], [3, 2], [1]])]
+)
+async def test_paginator_keyset(cursor, page_range, expected):  # noqa: D103
+    http_client = FakeHttpClient(7, item=author, cursor=cursor)
+    paginator = Paginator(
+        *page_range,
+        http_client=http_client,  # type: ignore
+        url="",
+        model=mdl.Author,
+        limit=2,
+        keyset=True
+    )
+
+    pages = [[author.id for author in page.items] async for page in paginator]
+
+    assert pages == expected
+    assert all("page" not in params for params in http_client.requested)
+
+
+def test_paginator_keyset_with_prefetch():  # noqa: D103
+    with pytest.raises(ValueError):
+        Paginator(
+            1,
+            http_client=FakeHttpClient(1, item=author, cursor=True),  # type: ignore
+            url="",
+            model=mdl.Author,
+            prefetch=2,
+            keyset=True
+        )
+
+
+@pytest.mark.parametrize(
+    ["watermark", "expected"],
+    [
+        (Watermark(id=6), [10, 9, 8, 7]),
+        (
+            Watermark(created_at=datetime.fromtimestamp(1_600_000_003)),
+            [10, 9, 8, 7, 6, 5, 4]
+        ),
+        (Watermark(), list(range(10, 0, -1)))
+    ]
+)
+async def test_paginator_with_watermark(watermark, expected):  # noqa: D103
+    async with Paginator(
+        10,
+        http_client=FakeHttpClient(10, item=post),  # type: ignore
+        url="",
+        model=mdl.Post,
+        limit=3,
+        prefetch=2,
+        fields=["id", "created_at"],
+        watermark=watermark
+    ) as paginator:
+        ids = [post.id async for page in paginator for post in page.items]
+
+    assert ids == expected
+    assert watermark.id == 10  # noqa: PLR2004
+
+
+async def test_paginator_keeps_watermark_until_completion():  # noqa: D103
+    watermark = Watermark(id=2)
+    async with Paginator(
+        10,
+        http_client=FakeHttpClient(10, item=post),  # type: ignore
+        url="",
+        model=mdl.Post,
+        limit=3,
+        fields=["id", "created_at"],
+        watermark=watermark
+    ) as paginator:
+        await paginator.__anext__()
+
+    assert watermark.id == 2  # noqa: PLR2004
+
+
+async def test_paginator_keeps_watermark_after_range_stop():  # noqa: D103
+    watermark = Watermark(id=2)
+    async with Paginator(
+        2,
+        http_client=FakeHttpClient(10, item=post),  # type: ignore
+        url="",
+        model=mdl.Post,
+        limit=3,
+        fields=["id", "created_at"],
+        watermark=watermark
+    ) as paginator:
+        ids = [post.id async for page in paginator for post in page.items]
+
+    # Range stops before watermark, so posts 4 and 3 remain unseen.
+    assert ids == [10, 9, 8, 7, 6, 5]
+    assert watermark.id == 2  # noqa: PLR2004
+
+
+async def test_paginator_resumes_from_checkpoint(tmp_path):  # noqa: D103
+    store = FileCheckpointStore(tmp_path / "checkpoint.json")
+    http_client = FakeHttpClient(5, item=author)
+
+    paginator = Paginator(
+        10,
+        http_client=http_client,  # type: ignore
+        url="",
+        model=mdl.Author,
+        limit=1,
+        checkpoint=store
+    )
+    await paginator.__anext__()
+    await paginator.__anext__()
+    # Position is saved when the next page is requested, so the page that
+    # was in processing at the moment of interruption is fetched again.
+    paginator.close()
+
+    paginator = Paginator(
+        10,
+        http_client=http_client,  # type: ignore
+        url="",
+        model=mdl.Author,
+        limit=1,
+        checkpoint=store
+    )
+    numbers = [page.number async for page in paginator]
+
+    assert numbers == [1, 2, 3, 4]
+    assert store.load() is None
+
+
+async def test_paginator_resumes_with_dedup(tmp_path):  # noqa: D103
+    store = FileCheckpointStore(tmp_path / "checkpoint.json")
+    # One post is uploaded after each page, so the last post of every page
+    # is shifted to the next one.
+    http_client = FakeHttpClient(9, shift=1)
+
+    def make_paginator() -> Paginator:
+        return Paginator(
+            5,
+            http_client=http_client,  # type: ignore
+            url="",
+            model=mdl.Post,
+            limit=3,
+            fields=["id"],
+            dedup=True,
+            checkpoint=store
+        )
+
+    paginator = make_paginator()
+    ids = [post.id for post in (await paginator.__anext__()).items]
+    await paginator.__anext__()
+    # The second page was in processing when iteration was interrupted.
+    paginator.close()
+    ids += [post.id async for page in make_paginator() for post in page.items]
+
+    assert ids == list(range(9, 0, -1))
+
+
+def test_paginator_with_checkpoint_of_another_query(tmp_path):  # noqa: D103
+    store = FileCheckpointStore(tmp_path / "checkpoint.json")
+    store.save(
+        Paginator(
+            1,
+            http_client=FakeHttpClient(1, item=author),  # type: ignore
+            url="",
+            model=mdl.Author,
+            limit=10
+        )._dump()
+    )
+
+    with pytest.raises(ValueError):
+        Paginator(
+            1,
+            http_client=FakeHttpClient(1, item=author),  # type: ignore
+            url="",
+            model=mdl.Author,
+            checkpoint=store
+        )
+
+
+def test_file_checkpoint_store(tmp_path):  # noqa: D103
+    store = FileCheckpointStore(tmp_path / "checkpoint.json")
+    assert store.load() is None
+
+    store.save({"page": 1})
+    store.save({"page": 2})
+    assert store.load() == {"page": 2}
+    assert [path.name for path in tmp_path.iterdir()] == ["checkpoint.json"]
+
+    store.clear()
+    assert store.load() is None
+
+
+@pytest.mark.parametrize(
+    ["shift", "dedup", "backfill", "expected"],
+    [
+        (1, False, False, [9, 8, 7, 7, 6, 5, 5, 4, 3, 3, 2, 1, 1]),
+        (1, True, False, [9, 8, 7, 6, 5, 4, 3, 2, 1]),
+        (-1, False, False, [9, 8, 7, 5, 4, 3, 1]),
+        (-1, True, True, [9, 8, 7, 6, 5, 4, 3, 2, 1])
+    ]
+)
+async def test_paginator_dedup(shift, dedup, backfill, expected):  # noqa: D103
+    paginator = Paginator(
+        5,
+        http_client=FakeHttpClient(9, shift=shift),  # type: ignore
+        url="",
+        model=mdl.Post,
+        limit=3,
+        fields=["id"],
+        dedup=dedup,
+        backfill=backfill
+    )
+
+    ids = [post.id async for page in paginator for post in page.items]
+
+    assert ids == expected
+
+
+async def test_paginator_backfills_gap_larger_than_page():  # noqa: D103
+    http_client = FakeHttpClient(30)
+    paginator = Paginator(
+        10,
+        http_client=http_client,  # type: ignore
+        url="",
+        model=mdl.Post,
+        limit=3,
+        prefetch=1,
+        fields=["id"],
+        backfill=True
+    )
+
+    ids = [post.id for _ in range(2) for post in (await paginator.__anext__()).items]
+    # Returned posts are deleted, so the next page skips two pages of posts.
+    http_client.ids = [i for i in http_client.ids if i not in ids]
+    ids += [post.id async for page in paginator for post in page.items]
+
+    assert ids == list(range(30, 0, -1))
+
+
+@pytest.mark.parametrize(
+    ["posts", "total", "stop_on_short_page", "expected"],
+    [
+        (7, None, True, 3),
+        (7, None, False, 4),
+        (6, None, True, 3),
+        (6, 6, False, 2),
+        (0, 0, False, 0)
+    ]
+)
+async def test_paginator_skips_empty_last_page(  # noqa: D103
+    posts,
+    total,
+    stop_on_short_page,
+    expected
+):
+    http_client = FakeHttpClient(posts)
+    paginator = Paginator(
+        10,
+        http_client=http_client,  # type: ignore
+        url="",
+        model=mdl.Post,
+        limit=3,
+        fields=["id"],
+        total=total,
+        stop_on_short_page=stop_on_short_page
+    )
+
+    assert len([post async for page in paginator for post in page.items]) == posts
+    assert len(http_client.requested) == expected
@@ -0,0 +1,41 @@
+import pytest
+from aiohttp.test_utils import TestServer
+
+from sankaku import constants as const, errors
+from sankaku.clients import SankakuClient
+from sankaku.models.http import Endpoints
+from sankaku.proxy import CachingProxy
+from tests.conftest import FakeResponse
+
+
+async def test_caching_proxy(monkeypatch):  # noqa: D103
+    proxy = CachingProxy()
+    sent = []
+
+    async def request(method: str, url: str, **kwargs) -> FakeResponse:  # noqa: ARG001
+        sent.append(url)
+        post_id = int(url.rsplit("/", 1)[1])
+        if post_id < 0:
+            return FakeResponse(404, b"{}")
+        return FakeResponse(200, f'{{"id": {post_id}}}'.encode())
+
+    async with TestServer(proxy.create_app()) as server:
+        monkeypatch.setattr(proxy.http_client.session, "request", request)
+        client = SankakuClient(
+            validation="trusted",
+            endpoints=Endpoints(api_url=str(server.make_url("")))
+        )
+
+        posts = [await client.get_post(post_id) for post_id in (1, 2, 1)]
+        for _ in range(2):
+            with pytest.raises(errors.PageNotFoundError):
+                await client.get_post(-1)
+        await client._http_client.close()
+
+    assert [post.id for post in posts] == [1, 2, 1]
+    assert sent == [
+        const.POST_URL.format(post_id=1),
+        const.POST_URL.format(post_id=2),
+        const.POST_URL.format(post_id=-1),
+        const.POST_URL.format(post_id=-1)
+    ]
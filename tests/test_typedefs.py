@@ -0,0 +1,34 @@
+from datetime import datetime
+
+import pytest
+
+from sankaku.typedefs import DatePartition, IdPartition
+
+
+@pytest.mark.parametrize(
+    ["partition", "expected"],
+    [
+        (
+            IdPartition(1, 100, shards=3),
+            ["id_range:1..33", "id_range:34..66", "id_range:67..99"]
+        ),
+        (
+            IdPartition(1, 3, shards=4),
+            ["id_range:1..1", "id_range:2..2"]
+        ),
+        (
+            DatePartition(datetime(2023, 1, 1), datetime(2023, 1, 3), shards=2),
+            [
+                "date:2023-01-01T00:00..2023-01-01T23:59",
+                "date:2023-01-02T00:00..2023-01-02T23:59"
+            ]
+        )
+    ]
+)
+def test_partition_tags(partition, expected):  # noqa: D103
+    assert partition.tags() == expected
+
+
+def test_empty_partition():  # noqa: D103
+    with pytest.raises(ValueError):
+        IdPartition(10, 10, shards=2)
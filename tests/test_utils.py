@@ -1,3 +1,5 @@
+import asyncio
+import time
 from datetime import datetime
 
 import pytest
@@ -27,6 +29,73 @@ async def test_ratelimit(rps, rpm):  # noqa: D103
     await idle_request()
 
 
+@pytest.mark.parametrize(
+    ["rps", "rpm", "burst", "expected"],
+    [
+        (200, 200, 1, errors.RateLimitError),
+        (None, None, 1, TypeError),
+        (3, None, 0, ValueError)
+    ]
+)
+def test_ratelimiter_with_incompatible_args(rps, rpm, burst, expected):  # noqa: D103
+    with pytest.raises(expected):
+        utils.RateLimiter(rps=rps, rpm=rpm, burst=burst)
+
+
+async def test_ratelimiter_burst():  # noqa: D103
+    limiter = utils.RateLimiter(rps=10, burst=5)
+
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire() for _ in range(5)))
+    assert time.monotonic() - start < 0.05  # noqa: PLR2004
+
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+    assert time.monotonic() - start >= 0.25  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ["status", "latency", "retry_after", "grows"],
+    [
+        (200, 0.1, None, True),
+        (200, 5, None, False),
+        (429, 0.1, None, False),
+        (503, 0.1, None, False),
+        (None, 0.1, None, False),
+        (200, 0.1, 1, False)
+    ]
+)
+async def test_adaptive_ratelimiter_feedback(status, latency, retry_after, grows):  # noqa: D103
+    limiter = utils.AdaptiveRateLimiter(rps=2, concurrency=2, target_latency=1)
+
+    await limiter.acquire()
+    limiter.feedback(status, latency, retry_after)
+
+    assert limiter.in_flight == 0
+    if grows:
+        assert limiter.rate > 2  # noqa: PLR2004
+        assert limiter.concurrency == 2  # noqa: PLR2004
+    elif status == 200 and retry_after is None:  # noqa: PLR2004
+        assert limiter.rate == 2  # noqa: PLR2004
+    else:
+        assert limiter.rate == 1
+        assert limiter.concurrency == 1
+
+
+async def test_adaptive_ratelimiter_concurrency():  # noqa: D103
+    limiter = utils.AdaptiveRateLimiter(rps=100, burst=10, concurrency=2)
+
+    await limiter.acquire()
+    await limiter.acquire()
+    waiting = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0.01)
+    assert not waiting.done()
+
+    limiter.feedback(200, 0.1)
+    await asyncio.wait_for(waiting, 1)
+    assert limiter.in_flight == 2  # noqa: PLR2004
+
+
 @pytest.mark.parametrize(
     ["ts", "expected"],
     [
@@ -50,3 +119,41 @@ async def test_ratelimit(rps, rpm):  # noqa: D103
 )
 def test_convert_ts_to_datetime(ts, expected):  # noqa: D103
     assert utils.convert_ts_to_datetime(ts) == expected
+
+
+def test_seen_ids():  # noqa: D103
+    seen = utils.SeenIds()
+
+    assert seen.add(40_000_000)
+    assert seen.add(3)
+    assert not seen.add(3)
+    assert 3 in seen  # noqa: PLR2004
+    assert 4 not in seen  # noqa: PLR2004
+    assert 50_000_000 not in seen  # noqa: PLR2004
+    assert len(seen) == 2  # noqa: PLR2004
+
+    loaded = utils.SeenIds.load(seen.dump())
+    assert 40_000_000 in loaded  # noqa: PLR2004
+    assert 3 in loaded  # noqa: PLR2004
+    assert 4 not in loaded  # noqa: PLR2004
+    assert len(loaded) == 2  # noqa: PLR2004
+
+
+def test_model_cache(monkeypatch):  # noqa: D103
+    now = 0.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache = utils.ModelCache(maxsize=2, ttl={"post": 10, "user": 0})
+
+    cache.put("post", 1, "first")
+    cache.put("post", 2, "second")
+    cache.put("user", 1, "user")
+    assert cache.get("post", 1) == "first"
+    cache.put("tag", "name", "tag")
+    assert cache.get("post", 2) is None  # Least recently used one is evicted
+    assert cache.get("user", 1) is None
+
+    now = 10.0
+    assert cache.get("post", 1) is None
+    assert cache.get("tag", "name") == "tag"
+    assert (cache.hits, cache.misses) == (2, 3)
+    assert len(cache) == 1